@@ -1,20 +1,24 @@
 """CLI entry point for LOAC QA Pipeline."""
 
+import importlib
 import sys
 
 import src.cli.utils as cli_utils
-from src.cli.commands import (
-    cmd_all,
-    cmd_eval,
-    cmd_parse,
-    cmd_questions,
-    cmd_rules,
-    cmd_score,
-    cmd_validate,
-)
 from src.cli.parser import parse_args
 from src.cli.utils import clean_cache_by_command
 
+# Subcommand name -> "module:attr" of its handler. Resolved on dispatch so the
+# pipeline and OpenAI client modules are only imported when a command runs.
+_COMMAND_HANDLERS = {
+    "parse": "src.cli.commands:cmd_parse",
+    "rules": "src.cli.commands:cmd_rules",
+    "questions": "src.cli.commands:cmd_questions",
+    "validate": "src.cli.commands:cmd_validate",
+    "eval": "src.cli.commands:cmd_eval",
+    "score": "src.cli.commands:cmd_score",
+    "all": "src.cli.commands:cmd_all",
+}
+
 
 def main(argv=None):
     """Main CLI entry point.
@@ -33,6 +37,7 @@ def main(argv=None):
         cli_utils.VERBOSE_MODE = args.verbose
         cli_utils.DRY_RUN_MODE = args.dry_run
         cli_utils.IGNORE_CACHE = args.ignore_cache
+        cli_utils.COMPACT_PROMPT_MODE = args.compact_prompts
 
         # Dry-run implies verbose and ignore-cache
         if args.dry_run:
@@ -51,24 +56,16 @@ def main(argv=None):
             return 0
 
         # Route to command handler
-        command_handlers = {
-            "parse": cmd_parse,
-            "rules": cmd_rules,
-            "questions": cmd_questions,
-            "validate": cmd_validate,
-            "eval": cmd_eval,
-            "score": cmd_score,
-            "all": cmd_all,
-        }
-
-        handler = command_handlers.get(args.command)
-        if handler:
-            handler(args)
-            return 0
-        else:
+        handler_path = _COMMAND_HANDLERS.get(args.command)
+        if handler_path is None:
             print(f"Unknown command: {args.command}", file=sys.stderr)
             return 1
 
+        module_path, attr = handler_path.split(":")
+        handler = getattr(importlib.import_module(module_path), attr)
+        handler(args)
+        return 0
+
     except KeyboardInterrupt:
         print("\n\nInterrupted by user", file=sys.stderr)
         return 1
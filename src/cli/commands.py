@@ -1,24 +1,27 @@
 """Command handlers for each CLI subcommand."""
 
-import json
-from collections import Counter
+import gzip
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, List
 
+import ijson
+
 from src.cli.utils import (
+    ensure_dir,
     filter_questions,
     filter_rules,
     filter_sections,
+    invalidate_section_cache,
     load_json_file,
     log_verbose,
     print_summary,
+    save_json_file,
 )
-from src.lib.openai_client import get_openai_client
-from src.pipeline.evaluate import run_evaluation
-from src.pipeline.extract import extract_rules
-from src.pipeline.generate import generate_questions_for_rule
-from src.pipeline.parse import parse_document
-from src.pipeline.validate import generate_validation_analysis, validate_and_filter_questions
+from src.config import IO_BUFFER_SIZE, LLM_MAX_CONCURRENCY, SECTIONS_PATHS
 
 
 def cmd_parse(args):
@@ -26,7 +29,12 @@ def cmd_parse(args):
 
     Args:
         args: Parsed command-line arguments
+
+    Returns:
+        Dict of parsed sections (section_id -> section_data)
     """
+    from src.pipeline.parse import parse_document
+
     log_verbose(f"Parsing PDF: {args.pdf}")
     if args.section:
         log_verbose(f"Filtering to sections starting with: {args.section}")
@@ -34,25 +42,33 @@ def cmd_parse(args):
     # Parse document
     sections = parse_document(args.pdf, section_prefix=args.section)
 
-    # Save to file
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(sections, f, indent=2, ensure_ascii=False)
+    # Save to file; drop any sections memoized by load_section_text
+    save_json_file(sections, args.output)
+    invalidate_section_cache()
 
     print(f"✓ Extracted {len(sections)} sections")
     print(f"✓ Saved to {args.output}")
 
+    return sections
+
 
 def cmd_rules(args):
     """Execute 'rules' command - extract legal rules from sections.
 
     Args:
         args: Parsed command-line arguments
+
+    Returns:
+        List of extracted rules
     """
-    log_verbose(f"Loading sections from: {args.input}")
+    from src.lib.openai_client import get_openai_client
+    from src.pipeline.extract import extract_rules_batch, plan_rule_batches
 
-    # Load sections
-    sections = load_json_file(args.input)
+    # Use sections handed over in memory (e.g. by 'all'), else load them
+    sections = getattr(args, "sections", None)
+    if sections is None:
+        log_verbose(f"Loading sections from: {args.input}")
+        sections = load_json_file(args.input)
 
     # Filter sections if requested
     if args.section:
@@ -61,42 +77,64 @@ def cmd_rules(args):
 
     if not sections:
         print("No sections found matching filter criteria")
-        return
+        return []
 
     log_verbose(f"Processing {len(sections)} sections")
 
-    # Get OpenAI client
-    client = get_openai_client()
-
-    all_rules = []
-
-    # Extract rules from each section
-    for section_id, section_data in sections.items():
-        log_verbose(f"Processing section {section_id}...")
-        print(f"Processing {section_id}...")
-        rules = extract_rules(section_id, section_data, client)
-        all_rules.extend(rules)
-        log_verbose(f"  Extracted {len(rules)} rules from {section_id}")
+    # Get OpenAI client, reusing one created ahead of time by 'all'
+    client = getattr(args, "client", None) or get_openai_client()
+
+    # Group consecutive sections into batches (single sections unless --batch-size)
+    batches = plan_rule_batches(sections, getattr(args, "batch_size", 1))
+    if len(batches) < len(sections):
+        log_verbose(f"Batching {len(sections)} sections into {len(batches)} LLM calls")
+
+    # Extract rules from each batch concurrently, collecting results in section order
+    with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+        futures = []
+        for batch in batches:
+            for section_id in batch:
+                log_verbose(f"Processing section {section_id}...")
+                print(f"Processing {section_id}...")
+            futures.append((batch, executor.submit(extract_rules_batch, batch, client)))
+
+        rule_batches = []
+        for batch, future in futures:
+            rules_by_section = future.result()
+            for section_id in batch:
+                rules = rules_by_section[section_id]
+                rule_batches.append(rules)
+                log_verbose(f"  Extracted {len(rules)} rules from {section_id}")
+
+    # Flatten per-section results once, in C
+    all_rules = list(chain.from_iterable(rule_batches))
 
     # Save all rules
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(all_rules, f, indent=2, ensure_ascii=False)
+    save_json_file(all_rules, args.output)
 
     print(f"\n✓ Extracted {len(all_rules)} total rules")
     print(f"✓ Saved to {args.output}")
 
+    return all_rules
+
 
 def cmd_questions(args):
     """Execute 'questions' command - generate questions from rules.
 
     Args:
         args: Parsed command-line arguments
+
+    Returns:
+        List of generated questions
     """
-    log_verbose(f"Loading rules from: {args.input}")
+    from src.lib.openai_client import get_openai_client
+    from src.pipeline.generate import generate_questions_for_rule
 
-    # Load rules
-    rules = load_json_file(args.input)
+    # Use rules handed over in memory (e.g. by 'all'), else load them
+    rules = getattr(args, "rules", None)
+    if rules is None:
+        log_verbose(f"Loading rules from: {args.input}")
+        rules = load_json_file(args.input)
 
     # Filter rules if requested
     if args.rule_id:
@@ -105,7 +143,7 @@ def cmd_questions(args):
 
     if not rules:
         print("No rules found matching filter criteria")
-        return
+        return []
 
     log_verbose(f"Generating questions for {len(rules)} rules")
 
@@ -124,46 +162,59 @@ def cmd_questions(args):
     else:
         question_types = None  # Generate all types
 
-    # Get OpenAI client
-    client = get_openai_client()
-
-    all_questions = []
+    # Get OpenAI client, reusing one created ahead of time by 'all'
+    client = getattr(args, "client", None) or get_openai_client()
 
     # Group rules by section for better organization
-    rules_by_section: Dict[str, List[Dict[str, Any]]] = {}
+    rules_by_section: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for rule in rules:
-        section_id = rule["source_section"]
-        if section_id not in rules_by_section:
-            rules_by_section[section_id] = []
-        rules_by_section[section_id].append(rule)
-
-    # Generate questions for each section's rules
-    for section_id, section_rules in rules_by_section.items():
-        print(f"\nProcessing {section_id}: {len(section_rules)} rules")
-
-        for rule_index, rule in enumerate(section_rules):
-            rule_id = rule.get("rule_id", f"{section_id}_r{rule_index}")
-            log_verbose(f"  Rule {rule_id}: {rule['rule_type']}")
-            print(f"  Rule {rule_index + 1}/{len(section_rules)}: {rule['rule_type']}")
-
-            questions = generate_questions_for_rule(
-                rule, section_id, rule_index, client, question_types_filter=question_types
-            )
-            all_questions.extend(questions)
+        rules_by_section[rule["source_section"]].append(rule)
+
+    # Generate questions for each section's rules concurrently, collecting in rule order
+    with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+        futures = []
+        for section_id, section_rules in rules_by_section.items():
+            print(f"\nProcessing {section_id}: {len(section_rules)} rules")
+
+            for rule_index, rule in enumerate(section_rules):
+                rule_id = rule.get("rule_id", f"{section_id}_r{rule_index}")
+                log_verbose(f"  Rule {rule_id}: {rule['rule_type']}")
+                print(f"  Rule {rule_index + 1}/{len(section_rules)}: {rule['rule_type']}")
+
+                futures.append(
+                    executor.submit(
+                        generate_questions_for_rule,
+                        rule,
+                        section_id,
+                        rule_index,
+                        client,
+                        question_types_filter=question_types,
+                    )
+                )
+
+        # Tally question types as results arrive instead of re-scanning afterwards
+        type_counts = Counter()
+        question_batches = []
+        for future in futures:
+            questions = future.result()
+            question_batches.append(questions)
+            type_counts.update(q["question_type"] for q in questions)
+
+    # Flatten per-rule results once, in C
+    all_questions = list(chain.from_iterable(question_batches))
 
     # Save all questions
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(all_questions, f, indent=2, ensure_ascii=False)
+    save_json_file(all_questions, args.output)
 
     # Print summary
-    type_counts = Counter(q["question_type"] for q in all_questions)
     print(f"\n✓ Generated {len(all_questions)} total questions")
     print(f"✓ Saved to {args.output}")
     print("\nQuestion breakdown:")
     for qtype, count in sorted(type_counts.items()):
         print(f"  - {qtype}: {count}")
 
+    return all_questions
+
 
 def cmd_validate(args):
     """Execute 'validate' command - validate generated questions.
@@ -171,10 +222,18 @@ def cmd_validate(args):
     Args:
         args: Parsed command-line arguments
     """
-    log_verbose(f"Loading questions from: {args.input}")
+    from src.lib.openai_client import get_openai_client
+    from src.pipeline.export import export_to_csv
+    from src.pipeline.validate import (
+        generate_validation_analysis,
+        validate_and_filter_questions,
+    )
 
-    # Load questions
-    questions = load_json_file(args.input)
+    # Use questions handed over in memory (e.g. by 'all'), else load them
+    questions = getattr(args, "questions", None)
+    if questions is None:
+        log_verbose(f"Loading questions from: {args.input}")
+        questions = load_json_file(args.input)
 
     # Filter questions if requested
     if args.question_id:
@@ -187,34 +246,40 @@ def cmd_validate(args):
 
     log_verbose(f"Validating {len(questions)} questions (threshold: {args.threshold})")
 
-    # Load parsed sections for structural validation
-    # Try multiple locations
-    sections_paths = ["data/extracted/sections.json", "data/extracted/section_5_5.json"]
-    parsed_sections = None
-    for path in sections_paths:
-        try:
-            parsed_sections = load_json_file(path)
-            log_verbose(f"Loaded sections from {path}")
-            break
-        except FileNotFoundError:
-            continue
+    # Load parsed sections for structural validation, unless the caller
+    # (e.g. 'all') already has them in memory. Otherwise try multiple locations
+    parsed_sections = getattr(args, "parsed_sections", None)
+    if parsed_sections is not None:
+        log_verbose("Using parsed sections from previous stage")
+    else:
+        for path in SECTIONS_PATHS:
+            try:
+                parsed_sections = load_json_file(path)
+                log_verbose(f"Loaded sections from {path}")
+                break
+            except FileNotFoundError:
+                continue
 
     if parsed_sections is None:
         print("Warning: Could not find parsed sections file")
-        print("Tried:", ", ".join(sections_paths))
+        print("Tried:", ", ".join(SECTIONS_PATHS))
         print("Structural validation will be limited")
         parsed_sections = {}
 
-    # Load rules for validation
-    try:
-        rules = load_json_file("data/extracted/rules.json")
-    except FileNotFoundError:
-        print("Warning: Could not find rules.json")
-        print("Validation may be limited")
-        rules = []
+    # Load rules for validation, unless the caller already has them in memory
+    rules = getattr(args, "rules", None)
+    if rules is not None:
+        log_verbose("Using rules from previous stage")
+    else:
+        try:
+            rules = load_json_file("data/extracted/rules.json")
+        except FileNotFoundError:
+            print("Warning: Could not find rules.json")
+            print("Validation may be limited")
+            rules = []
 
-    # Get OpenAI client
-    client = get_openai_client()
+    # Get OpenAI client, reusing one created ahead of time by 'all'
+    client = getattr(args, "client", None) or get_openai_client()
 
     # Validate and filter
     # Note: threshold is currently hardcoded to 90 in validation logic
@@ -224,34 +289,34 @@ def cmd_validate(args):
         questions, parsed_sections, rules, client=client
     )
 
-    # Save validated questions
-    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(validated_questions, f, indent=2, ensure_ascii=False)
-
-    # Save rejected questions with reasons
-    rejected_output = Path(args.output).parent / "questions_rejected.json"
-    with open(rejected_output, "w", encoding="utf-8") as f:
-        json.dump(rejected_questions, f, indent=2, ensure_ascii=False)
-
-    # Save validation report
-    report_output = Path(args.output).parent / "validation_report.json"
-    with open(report_output, "w", encoding="utf-8") as f:
-        json.dump(validation_report, f, indent=2, ensure_ascii=False)
-
-    # Generate and save analysis report
-    analysis_report = generate_validation_analysis(
-        questions, validated_questions, rejected_questions, validation_report, rules
-    )
-    analysis_output = Path(args.output).parent / "validation_analysis.txt"
-    with open(analysis_output, "w", encoding="utf-8") as f:
-        f.write(analysis_report)
-
-    # Export to CSV
-    from src.pipeline.export import export_to_csv
-
-    csv_output = Path(args.output).parent / "benchmark_questions.csv"
-    export_to_csv(validated_questions, str(csv_output))
+    output_dir = Path(args.output).parent
+    ensure_dir(output_dir)
+    rejected_output = output_dir / "questions_rejected.json"
+    report_output = output_dir / "validation_report.json"
+    analysis_output = output_dir / "validation_analysis.txt"
+    csv_output = output_dir / "benchmark_questions.csv"
+
+    # Write the artifacts concurrently; the analysis report is built meanwhile
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writes = [
+            # Validated questions, rejected questions with reasons, validation report
+            executor.submit(save_json_file, validated_questions, args.output),
+            executor.submit(save_json_file, rejected_questions, str(rejected_output)),
+            executor.submit(save_json_file, validation_report, str(report_output)),
+            # Export to CSV
+            executor.submit(export_to_csv, validated_questions, str(csv_output)),
+        ]
+
+        # Generate and save analysis report
+        analysis_report = generate_validation_analysis(
+            questions, validated_questions, rejected_questions, validation_report, rules
+        )
+        with open(analysis_output, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+            f.write(analysis_report)
+
+        # Surface any write error
+        for future in writes:
+            future.result()
 
     # Print results
     print_summary(
@@ -306,6 +371,9 @@ def cmd_eval(args):
     Args:
         args: Parsed command-line arguments
     """
+    from src.lib.openai_client import get_openai_client
+    from src.pipeline.evaluate import run_evaluation
+
     log_verbose(f"Loading questions from: {args.input}")
     log_verbose(f"Target model: {args.model}")
 
@@ -326,6 +394,8 @@ def cmd_eval(args):
         model=args.model,
         question_filter=args.question_id,
         client=client,
+        batch=getattr(args, "batch", False),
+        max_concurrency=getattr(args, "max_concurrency", LLM_MAX_CONCURRENCY),
     )
 
     print("\n✓ Evaluation complete")
@@ -354,17 +424,17 @@ def cmd_score(args):
         print("Run 'eval' command first to generate evaluation responses")
         return
 
-    # Load evaluation responses
-    with open(args.input, "r", encoding="utf-8") as f:
-        eval_data = json.load(f)
-
-    print(f"Scoring {len(eval_data)} responses...")
+    # Stream evaluation responses straight into scoring rather than loading the
+    # whole file; only the (much smaller) scored results are kept in memory
+    print(f"Scoring responses from {args.input}...")
+    opener = gzip.open if input_path.suffix == ".gz" else open
+    with opener(args.input, "rb") as f:
+        scoring_output = score_evaluation(ijson.items(f, "item", use_float=True))
 
-    # Score responses
-    scoring_output = score_evaluation(eval_data)
+    print(f"Scored {scoring_output['metadata']['total_questions']} responses")
 
     # Analyze confusion (MC questions only)
-    mc_results = [r for r in scoring_output["scored_results"] if r["question_type"] != "refusal"]
+    mc_results = (r for r in scoring_output["scored_results"] if r["question_type"] != "refusal")
     confusion = analyze_confusion(mc_results)
 
     # Generate report
@@ -379,8 +449,8 @@ def cmd_score(args):
 
     # Save report
     report_path = Path(args.report)
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(report_path, "w", encoding="utf-8") as f:
+    ensure_dir(report_path.parent)
+    with open(report_path, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         f.write(report_text)
     print(f"Analysis report saved to: {args.report}")
 
@@ -395,6 +465,20 @@ def cmd_all(args):
 
     output_dir = Path(args.output_dir)
 
+    # Outputs of each phase are handed to the next ones in memory instead of
+    # re-read from disk; phases skipped by --resume leave them as None
+    sections = None
+    rules = None
+    questions = None
+
+    # Create the OpenAI client in the background while the (LLM-free) parse runs,
+    # then share it across the LLM phases
+    from src.lib.openai_client import get_openai_client
+
+    client_executor = ThreadPoolExecutor(max_workers=1)
+    client_future = client_executor.submit(get_openai_client)
+    client_executor.shutdown(wait=False)
+
     # Phase 1: Parse PDF
     parse_output = output_dir / "extracted" / "sections.json"
     if args.resume and parse_output.exists():
@@ -404,12 +488,8 @@ def cmd_all(args):
         print("Phase 1: Parse PDF")
         print("=" * 60)
         # Create a namespace for parse command
-        parse_args = type(
-            "obj",
-            (object,),
-            {"pdf": args.pdf, "section": args.section, "output": str(parse_output)},
-        )()
-        cmd_parse(parse_args)
+        parse_args = SimpleNamespace(pdf=args.pdf, section=args.section, output=str(parse_output))
+        sections = cmd_parse(parse_args)
 
     # Phase 2: Extract rules
     rules_output = output_dir / "extracted" / "rules.json"
@@ -419,12 +499,14 @@ def cmd_all(args):
         print("\n" + "=" * 60)
         print("Phase 2: Extract Rules")
         print("=" * 60)
-        rules_args = type(
-            "obj",
-            (object,),
-            {"input": str(parse_output), "section": args.section, "output": str(rules_output)},
-        )()
-        cmd_rules(rules_args)
+        rules_args = SimpleNamespace(
+            input=str(parse_output),
+            section=args.section,
+            output=str(rules_output),
+            sections=sections,
+            client=client_future.result(),
+        )
+        rules = cmd_rules(rules_args)
 
     # Phase 3: Generate questions
     questions_output = output_dir / "generated" / "questions.json"
@@ -434,17 +516,15 @@ def cmd_all(args):
         print("\n" + "=" * 60)
         print("Phase 3: Generate Questions")
         print("=" * 60)
-        questions_args = type(
-            "obj",
-            (object,),
-            {
-                "input": str(rules_output),
-                "rule_id": None,
-                "types": None,
-                "output": str(questions_output),
-            },
-        )()
-        cmd_questions(questions_args)
+        questions_args = SimpleNamespace(
+            input=str(rules_output),
+            rule_id=None,
+            types=None,
+            output=str(questions_output),
+            rules=rules,
+            client=client_future.result(),
+        )
+        questions = cmd_questions(questions_args)
 
     # Phase 4: Validate
     validated_output = output_dir / "validated" / "questions.json"
@@ -454,16 +534,16 @@ def cmd_all(args):
         print("\n" + "=" * 60)
         print("Phase 4: Validate Questions")
         print("=" * 60)
-        validate_args = type(
-            "obj",
-            (object,),
-            {
-                "input": str(questions_output),
-                "question_id": None,
-                "threshold": 90,
-                "output": str(validated_output),
-            },
-        )()
+        validate_args = SimpleNamespace(
+            input=str(questions_output),
+            question_id=None,
+            threshold=90,
+            output=str(validated_output),
+            parsed_sections=sections,
+            questions=questions,
+            rules=rules,
+            client=client_future.result(),
+        )
         cmd_validate(validate_args)
 
     print("\n" + "=" * 60)
@@ -1,11 +1,39 @@
 """Argument parser configuration for LOAC QA Pipeline CLI."""
 
 import argparse
+import functools
 import sys
 
+from src.config import LLM_MAX_CONCURRENCY
 
+
+def positive_int(value: str) -> int:
+    """Argparse type for options that must be a positive integer.
+
+    Args:
+        value: Raw command-line value
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer greater than 0
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser():
-    """Create the main argument parser with subcommands."""
+    """Create the main argument parser with subcommands.
+
+    The parser is built once and reused; parse_args() never mutates it.
+    """
     parser = argparse.ArgumentParser(
         prog="run_pipeline",
         description="LOAC QA Pipeline - Generate evaluation questions from legal documents",
@@ -53,6 +81,12 @@ Examples:
         action="store_true",
         help="Don't read or write cache (fresh run, no persistence)",
     )
+    parser.add_argument(
+        "--compact-prompts",
+        action="store_true",
+        help="Use shorter extraction/generation/validation prompts (results are cached "
+        "separately from full-prompt runs)",
+    )
     parser.add_argument("--config", metavar="FILE", help="Override default config file path")
 
     # Subcommands
@@ -114,6 +148,13 @@ Examples:
         default="data/extracted/rules.json",
         help="Save rules JSON (default: data/extracted/rules.json)",
     )
+    parser_rules.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help="Extract up to N consecutive sections per LLM call (default: 1, one call per section)",
+    )
 
     # Command: questions
     parser_questions = subparsers.add_parser(
@@ -189,6 +230,19 @@ Examples:
         default="data/evaluation/eval_responses.json",
         help="Evaluation responses JSON (default: data/evaluation/eval_responses.json)",
     )
+    parser_eval.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit questions through the OpenAI Batch API (slower turnaround, lower cost)",
+    )
+    parser_eval.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=LLM_MAX_CONCURRENCY,
+        metavar="N",
+        help="Maximum evaluation requests in flight; lower it to stay under the model's "
+        f"rate limit (default: {LLM_MAX_CONCURRENCY})",
+    )
 
     # Command: score
     parser_score = subparsers.add_parser(
@@ -1,16 +1,36 @@
 """Shared utilities for CLI: filtering, logging, dry-run, cache management."""
 
 import fnmatch
-import json
+import functools
+import gzip
+import mmap
+import operator
+import os
+import re
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import orjson
+
+from src.config import CACHE_CLEAN_WORKERS, IO_BUFFER_SIZE, SECTIONS_PATHS
 
 # Global flags for runtime behavior
 VERBOSE_MODE = False
 DRY_RUN_MODE = False
 IGNORE_CACHE = False
+COMPACT_PROMPT_MODE = False
+
+# Absolute paths of directories already created by ensure_dir() in this process
+_ensured_dirs = set()
+
+# Characters that make a filter pattern a glob rather than a literal ID
+_GLOB_META = re.compile(r"[*?\[]")
+
+# [epoch second, formatted timestamp] last used by log_verbose()
+_timestamp_cache = [None, ""]
 
 
 def filter_sections(sections: Dict[str, Any], prefix: Optional[str]) -> Dict[str, Any]:
@@ -18,20 +38,57 @@ def filter_sections(sections: Dict[str, Any], prefix: Optional[str]) -> Dict[str
 
     Args:
         sections: Dict of section_id -> section_data
-        prefix: Section prefix (e.g., "5.5" matches "5.5", "5.5.1", "5.5.2", etc.)
+        prefix: Section prefix (e.g., "5.5" matches "5.5", "5.5.1", "5.5.2", etc.,
+            but not "5.55")
 
     Returns:
-        Filtered dict of sections
+        Filtered dict of sections, in the original order
     """
     if not prefix:
         return sections
 
-    filtered = {}
-    for section_id, section_data in sections.items():
-        if section_id.startswith(prefix):
-            filtered[section_id] = section_data
+    # Single pass in insertion order; match whole dotted components only
+    subsection_prefix = prefix if prefix.endswith(".") else prefix + "."
+    return {
+        section_id: section_data
+        for section_id, section_data in sections.items()
+        if section_id == prefix or section_id.startswith(subsection_prefix)
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str):
+    """Compile a glob pattern once for matching many IDs.
+
+    Cached so repeated filters with the same pattern (e.g. across pipeline
+    phases in ``all``) skip fnmatch.translate and re.compile entirely.
+
+    Args:
+        pattern: Glob pattern (e.g., "5.5_r0_*")
+
+    Returns:
+        Match function for the pattern (case-sensitive); a plain string
+        comparison when the pattern has no glob metacharacters
+    """
+    if not _GLOB_META.search(pattern):
+        # Literal ID (e.g. "5.5_r0"): equality is what the translated regex would test
+        return functools.partial(operator.eq, pattern)
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _filter_by_id(items: List[Dict[str, Any]], id_field: str, pattern: str) -> List[Dict[str, Any]]:
+    """Keep items whose id_field matches a glob pattern (missing IDs count as "").
 
-    return filtered
+    Args:
+        items: List of dicts
+        id_field: Key holding the ID (e.g., "rule_id")
+        pattern: Glob pattern
+
+    Returns:
+        Filtered list of items
+    """
+    match = _compile_glob(pattern)
+    return [item for item in items if match(item.get(id_field, ""))]
 
 
 def filter_rules(rules: List[Dict[str, Any]], pattern: Optional[str]) -> List[Dict[str, Any]]:
@@ -47,13 +104,7 @@ def filter_rules(rules: List[Dict[str, Any]], pattern: Optional[str]) -> List[Di
     if not pattern:
         return rules
 
-    filtered = []
-    for rule in rules:
-        rule_id = rule.get("rule_id", "")
-        if fnmatch.fnmatch(rule_id, pattern):
-            filtered.append(rule)
-
-    return filtered
+    return _filter_by_id(rules, "rule_id", pattern)
 
 
 def filter_questions(
@@ -71,13 +122,7 @@ def filter_questions(
     if not pattern:
         return questions
 
-    filtered = []
-    for question in questions:
-        question_id = question.get("question_id", "")
-        if fnmatch.fnmatch(question_id, pattern):
-            filtered.append(question)
-
-    return filtered
+    return _filter_by_id(questions, "question_id", pattern)
 
 
 def log_verbose(message: str):
@@ -87,36 +132,58 @@ def log_verbose(message: str):
         message: Message to print
     """
     if VERBOSE_MODE or DRY_RUN_MODE:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {message}", file=sys.stderr)
+        # Format the timestamp at most once per second, in C via time.strftime
+        now = int(time.time())
+        if now != _timestamp_cache[0]:
+            _timestamp_cache[0] = now
+            _timestamp_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        print(f"[{_timestamp_cache[1]}] {message}", file=sys.stderr)
+
+
+def _unlink(path: str) -> str:
+    """Delete a file and return its path (for executor.map)."""
+    os.unlink(path)
+    return path
 
 
-def clean_cache_dir(cache_dir: str, pattern: Optional[str] = None):
+def clean_cache_dir(cache_dir: str, pattern: Optional[Union[str, Sequence[str]]] = None):
     """Delete cache files in a directory.
 
     Args:
         cache_dir: Cache directory path (e.g., "cache/rules")
-        pattern: Optional glob pattern for filtering (e.g., "5.5_*")
+        pattern: Optional glob pattern for filtering (e.g., "5.5_*"), or a sequence
+            of patterns; a file matching any of them is deleted
     """
     cache_path = Path(cache_dir)
     if not cache_path.exists():
         print(f"Cache directory not found: {cache_dir}")
         return
 
-    deleted_count = 0
-    if pattern:
-        # Filter by pattern
-        for cache_file in cache_path.glob("*.json"):
-            if fnmatch.fnmatch(cache_file.stem, pattern):
-                cache_file.unlink()
-                deleted_count += 1
-                print(f"Deleted: {cache_file}")
+    if pattern is None:
+        match = None
+    elif isinstance(pattern, str):
+        match = _compile_glob(pattern)
     else:
-        # Delete all
-        for cache_file in cache_path.glob("*.json"):
-            cache_file.unlink()
-            deleted_count += 1
-            print(f"Deleted: {cache_file}")
+        matchers = [_compile_glob(p) for p in pattern]
+
+        def match(stem):
+            return any(m(stem) for m in matchers)
+
+    # DirEntry names come straight from readdir, with no Path object per file
+    with os.scandir(cache_path) as entries:
+        to_delete = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json")
+            and (match is None or match(entry.name[: -len(".json")]))
+        ]
+
+    # unlink is syscall-bound and releases the GIL, so fan it out across threads
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=CACHE_CLEAN_WORKERS) as executor:
+            for path in executor.map(_unlink, to_delete):
+                log_verbose(f"Deleted: {path}")
+    deleted_count = len(to_delete)
 
     if deleted_count == 0:
         print(f"No cache files found matching criteria in {cache_dir}")
@@ -124,6 +191,23 @@ def clean_cache_dir(cache_dir: str, pattern: Optional[str] = None):
         print(f"Deleted {deleted_count} cache file(s) from {cache_dir}")
 
 
+def _section_cache_patterns(section: str) -> tuple:
+    """Cache file stem patterns for a section and its subsections.
+
+    Cache files are named after a section, rule or question ID, which starts
+    with the section ID followed by "." (subsection) or "_" (rule/question ID,
+    prompt-mode suffix). Matching whole components keeps "5.1" from also
+    selecting 5.10-5.19, which filter_sections would not regenerate.
+
+    Args:
+        section: Section filter (e.g., "5.1")
+
+    Returns:
+        Tuple of glob patterns for clean_cache_dir
+    """
+    return (section, f"{section}_*", f"{section}.*")
+
+
 def clean_cache_by_command(
     command: str,
     section: Optional[str] = None,
@@ -133,7 +217,7 @@ def clean_cache_by_command(
     """Clean cache based on command and filters.
 
     Args:
-        command: Command name (parse, rules, questions, validate, all)
+        command: Command name (parse, rules, questions, validate, eval, all)
         section: Section filter
         rule_id: Rule ID filter
         question_id: Question ID filter
@@ -143,10 +227,15 @@ def clean_cache_by_command(
     if command == "parse" or command == "all":
         clean_cache_dir("cache/parse")
 
+    # Question and validation cache files are named after rule/question IDs,
+    # which start with the section ID, so 'all --section' scopes them to the
+    # section too instead of wiping (and later regenerating) every section's cache
+    section_scope = _section_cache_patterns(section) if command == "all" and section else None
+
     if command == "rules" or command == "all":
         if section:
-            # Filter cache files by section prefix
-            clean_cache_dir("cache/rules", pattern=f"{section}*")
+            # Filter cache files by section (and its subsections)
+            clean_cache_dir("cache/rules", pattern=_section_cache_patterns(section))
         else:
             clean_cache_dir("cache/rules")
 
@@ -154,6 +243,8 @@ def clean_cache_by_command(
         if rule_id:
             # Filter cache files by rule_id pattern
             clean_cache_dir("cache/questions", pattern=f"{rule_id}*")
+        elif section_scope:
+            clean_cache_dir("cache/questions", pattern=section_scope)
         else:
             clean_cache_dir("cache/questions")
 
@@ -161,9 +252,18 @@ def clean_cache_by_command(
         if question_id:
             # Filter cache files by question_id pattern
             clean_cache_dir("cache/validation", pattern=f"{question_id}*")
+        elif section_scope:
+            clean_cache_dir("cache/validation", pattern=section_scope)
         else:
             clean_cache_dir("cache/validation")
 
+    if command == "eval":
+        if question_id:
+            # Eval cache files are named <question_id>_<request digest>
+            clean_cache_dir("cache/evaluation", pattern=f"{question_id}*")
+        else:
+            clean_cache_dir("cache/evaluation")
+
 
 def should_use_cache() -> bool:
     """Check if caching should be used.
@@ -174,11 +274,39 @@ def should_use_cache() -> bool:
     return not IGNORE_CACHE
 
 
+def prompt_cache_suffix() -> str:
+    """Cache file name suffix for the active prompt set.
+
+    Results produced with --compact-prompts are cached under their own names,
+    so full-prompt and compact-prompt runs never reuse each other's entries.
+
+    Returns:
+        "_compact" under --compact-prompts, otherwise ""
+    """
+    return "_compact" if COMPACT_PROMPT_MODE else ""
+
+
+def ensure_dir(path: Path):
+    """Create a directory (and parents) once per process.
+
+    Cache and output writes call this per item; after the first call for a
+    directory it is a set lookup instead of a stat/mkdir round trip.
+
+    Args:
+        path: Directory path
+    """
+    key = os.path.abspath(path)
+    if key in _ensured_dirs:
+        return
+    Path(key).mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
+
+
 def load_json_file(filepath: str) -> Any:
     """Load JSON file with error handling.
 
     Args:
-        filepath: Path to JSON file
+        filepath: Path to JSON file (gzip-compressed if it ends in ".gz")
 
     Returns:
         Parsed JSON data
@@ -187,12 +315,17 @@ def load_json_file(filepath: str) -> Any:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If JSON is malformed
     """
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Single unbuffered read of the raw bytes, parsed directly by orjson
+    # (orjson.JSONDecodeError subclasses json.JSONDecodeError); open() failing
+    # is the existence check, so there is no separate stat
+    try:
+        with open(filepath, "rb", buffering=0) as f:
+            raw = f.readall()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}") from None
+    if str(filepath).endswith(".gz"):
+        raw = gzip.decompress(raw)
+    return orjson.loads(raw)
 
 
 def save_json_file(data: Any, filepath: str):
@@ -200,13 +333,20 @@ def save_json_file(data: Any, filepath: str):
 
     Args:
         data: Data to save
-        filepath: Output file path
+        filepath: Output file path; a ".gz" suffix writes compact,
+            gzip-compressed JSON instead of indented text
     """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(path.parent)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if path.suffix == ".gz":
+        payload = gzip.compress(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        # Serialize to UTF-8 bytes in one go (same layout as json.dumps with
+        # indent=2, ensure_ascii=False) and issue a single write
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    with open(path, "wb", buffering=IO_BUFFER_SIZE) as f:
+        f.write(payload)
 
     log_verbose(f"Saved to {filepath}")
 
@@ -218,19 +358,53 @@ def print_summary(title: str, stats: Dict[str, Any]):
         title: Summary title
         stats: Dictionary of statistics to display
     """
-    print(f"\n{'=' * 60}")
-    print(title.center(60))
-    print("=" * 60)
-    for key, value in stats.items():
-        print(f"{key}: {value}")
-    print("=" * 60)
+    rule = "=" * 60
+    lines = ["", rule, title.center(60), rule]
+    lines.extend(f"{key}: {value}" for key, value in stats.items())
+    lines.append(rule)
+    # One write instead of a print per line
+    print("\n".join(lines))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sections_file(path_str: str) -> Dict[str, Any]:
+    """Load and memoize a parsed sections file.
+
+    Args:
+        path_str: Path to a sections JSON file
+
+    Returns:
+        Dict of section_id -> section_data
+
+    Raises:
+        FileNotFoundError: If file doesn't exist (not cached)
+    """
+    # Parse straight from a read-only mapping of the file: no separate read
+    # buffer, so peak memory is the parsed dict plus shared page cache
+    try:
+        with open(path_str, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b"")  # mmap refuses empty files; raise the usual error
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                return orjson.loads(view)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path_str}") from None
+
+
+def invalidate_section_cache():
+    """Forget memoized sections files (call after a sections file is rewritten)."""
+    _load_sections_file.cache_clear()
 
 
 def load_section_text(section_id: str) -> str:
     """Load section text for a given section ID.
 
     This function searches for parsed sections in known locations
-    and returns the text for the specified section.
+    and returns the text for the specified section. Each sections file
+    is parsed once per process; later lookups are dict accesses.
 
     Args:
         section_id: Section ID (e.g., "5.5.3")
@@ -239,15 +413,13 @@ def load_section_text(section_id: str) -> str:
         Section text, or empty string if not found
     """
     # Try multiple locations for sections file
-    sections_paths = ["data/extracted/sections.json", "data/extracted/section_5_5.json"]
-
-    for path_str in sections_paths:
-        path = Path(path_str)
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                sections = json.load(f)
-                if section_id in sections:
-                    return sections[section_id].get("text", "")
+    for path_str in SECTIONS_PATHS:
+        try:
+            sections = _load_sections_file(path_str)
+        except FileNotFoundError:
+            continue
+        if section_id in sections:
+            return sections[section_id].get("text", "")
 
     # If not found, return empty string
     return ""
@@ -2,7 +2,39 @@
 
 import csv
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Tuple
+
+from src.cli.utils import ensure_dir
+from src.config import IO_BUFFER_SIZE
+
+# CSV columns (matching template)
+CSV_FIELDNAMES = (
+    "Question Type",
+    "domain/doctrine",
+    "difficulty",
+    "prompt",
+    "response_one_ground_truth",
+    "response_two_incorrect",
+    "response_three_incorrect",
+    "response_four_incorrect",
+    "ref_text_1",
+    "ref_text_2",
+    "ref_text_3",
+    "Notes",
+)
+
+# Shared read-only fallback for optional nested fields, so a missing field
+# does not allocate a fresh empty dict per lookup
+_EMPTY = MappingProxyType({})
+
+# Difficulty by question type
+DIFFICULTY_MAP = {
+    "definitional": "Medium",
+    "scenario_easy": "Easy",
+    "scenario_hard": "Hard",
+    "refusal": "Medium",
+}
 
 
 def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
@@ -14,6 +46,18 @@ def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
     Returns:
         Dict with CSV column names as keys
     """
+    return dict(zip(CSV_FIELDNAMES, map_question_to_csv_tuple(question)))
+
+
+def map_question_to_csv_tuple(question: Dict) -> Tuple[str, ...]:
+    """Map internal question format to CSV row values.
+
+    Args:
+        question: Validated question dict
+
+    Returns:
+        Tuple of column values in CSV_FIELDNAMES order
+    """
     qtype = question["question_type"]
 
     # Determine question type for CSV
@@ -23,13 +67,7 @@ def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
         csv_qtype = "Closed QA"
 
     # Determine difficulty
-    difficulty_map = {
-        "definitional": "Medium",
-        "scenario_easy": "Easy",
-        "scenario_hard": "Hard",
-        "refusal": "Medium",
-    }
-    difficulty = difficulty_map.get(qtype, "Medium")
+    difficulty = DIFFICULTY_MAP.get(qtype, "Medium")
 
     # Build response columns
     if qtype == "refusal":
@@ -46,10 +84,10 @@ def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
 
     # Build reference texts
     # Note: source_rule is in metadata, not source_rule top-level field
-    metadata = question.get("metadata", {})
+    metadata = question.get("metadata", _EMPTY)
     source_rule_text = metadata.get("source_rule", "")
     source_section = metadata.get("source_section", "Unknown")
-    source_pages = metadata.get("source_page_numbers", [])
+    source_pages = metadata.get("source_page_numbers", ())
 
     ref_text_1 = source_rule_text
     ref_text_2 = f"DoD Law of War Manual, Section {source_section}"
@@ -70,7 +108,11 @@ def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
     confidence = question.get("confidence", 0)
 
     # Get validation scores (use minimum across all components as overall score)
-    components = question.get("_validation", {}).get("scoring_breakdown", {}).get("components", {})
+    components = (
+        question.get("_validation", _EMPTY)
+        .get("scoring_breakdown", _EMPTY)
+        .get("components", _EMPTY)
+    )
     if components:
         validation_score = min(components.values())
     else:
@@ -78,20 +120,20 @@ def map_question_to_csv_row(question: Dict) -> Dict[str, str]:
 
     notes = f"Rule: {rule_id}, Confidence: {confidence:.1f}, Validation: {validation_score:.1f}"
 
-    return {
-        "Question Type": csv_qtype,
-        "domain/doctrine": "Law of War - Section 5.5",
-        "difficulty": difficulty,
-        "prompt": question["question"],  # Field is "question", not "question_text"
-        "response_one_ground_truth": response_one,
-        "response_two_incorrect": response_two,
-        "response_three_incorrect": response_three,
-        "response_four_incorrect": response_four,
-        "ref_text_1": ref_text_1,
-        "ref_text_2": ref_text_2,
-        "ref_text_3": ref_text_3,
-        "Notes": notes,
-    }
+    return (
+        csv_qtype,
+        "Law of War - Section 5.5",
+        difficulty,
+        question["question"],  # Field is "question", not "question_text"
+        response_one,
+        response_two,
+        response_three,
+        response_four,
+        ref_text_1,
+        ref_text_2,
+        ref_text_3,
+        notes,
+    )
 
 
 def export_to_csv(questions: List[Dict], output_path: str):
@@ -102,33 +144,16 @@ def export_to_csv(questions: List[Dict], output_path: str):
         output_path: Path to save CSV file
     """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Define CSV columns (matching template)
-    fieldnames = [
-        "Question Type",
-        "domain/doctrine",
-        "difficulty",
-        "prompt",
-        "response_one_ground_truth",
-        "response_two_incorrect",
-        "response_three_incorrect",
-        "response_four_incorrect",
-        "ref_text_1",
-        "ref_text_2",
-        "ref_text_3",
-        "Notes",
-    ]
+    ensure_dir(output_file.parent)
 
     # Write CSV with UTF-8 BOM for Excel compatibility
-    with open(output_file, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(output_file, "w", encoding="utf-8-sig", newline="", buffering=IO_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
 
         for i, question in enumerate(questions):
             try:
-                row = map_question_to_csv_row(question)
-                writer.writerow(row)
+                writer.writerow(map_question_to_csv_tuple(question))
             except (KeyError, TypeError) as e:
                 question_id = question.get("question_id", f"index_{i}")
                 print(f"\nError exporting question {question_id}:")
@@ -1,14 +1,20 @@
 """Rule extraction from parsed sections using LLM."""
 
-import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from openai import OpenAI
+from src.cli.utils import load_json_file, prompt_cache_suffix, save_json_file
+from src.config import RULE_EXTRACTION_BATCH_TOKEN_BUDGET
+from src.pipeline.util import create_chat_completion, render_prompt
+
+# Annotations only; the openai package is slow to import and only needed once a
+# client is created
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 
 def extract_rules(
-    section_id: str, section_data: Dict, client: Optional[OpenAI] = None
+    section_id: str, section_data: Dict, client: Optional["OpenAI"] = None
 ) -> List[Dict]:
     """
     Extract legal rules from a section using GPT-4.1.
@@ -21,7 +27,7 @@ def extract_rules(
     Returns:
         List of rule dicts with extracted information
     """
-    from src.config import RULE_EXTRACTION_PROMPT
+    from src.config import RULE_EXTRACTION_PROMPT, RULES_RESPONSE_FORMAT
     from src.lib.openai_client import get_openai_client
 
     if client is None:
@@ -30,19 +36,19 @@ def extract_rules(
     # Check cache first (unless ignore_cache flag is set)
     from src.cli.utils import should_use_cache
 
-    cache_path = Path(f"cache/rules/{section_id}.json")
+    cache_path = Path(f"cache/rules/{section_id}{prompt_cache_suffix()}.json")
     if should_use_cache() and cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-            # Add rule_id if missing (backward compatibility)
-            for index, rule in enumerate(cached_data):
-                if "rule_id" not in rule:
-                    rule["rule_id"] = f"{section_id}_r{index}"
-            print(f"  [Cached] {len(cached_data)} rules")
-            return cached_data
+        cached_data = load_json_file(cache_path)
+        # Add rule_id if missing (backward compatibility)
+        for index, rule in enumerate(cached_data):
+            if "rule_id" not in rule:
+                rule["rule_id"] = f"{section_id}_r{index}"
+        print(f"  [Cached] {len(cached_data)} rules")
+        return cached_data
 
     # Build prompt
-    prompt = RULE_EXTRACTION_PROMPT.format(
+    prompt = render_prompt(
+        RULE_EXTRACTION_PROMPT,
         section_id=section_id,
         section_title=section_data["title"],
         section_text=section_data["text"],
@@ -50,7 +56,8 @@ def extract_rules(
 
     try:
         # Call OpenAI API
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4.1",
             messages=[
                 {
@@ -60,7 +67,7 @@ def extract_rules(
                 {"role": "user", "content": prompt},
             ],
             temperature=0.1,  # Low temperature for consistency
-            response_format={"type": "json_object"},
+            response_format=RULES_RESPONSE_FORMAT,
         )
 
         # Parse response
@@ -69,14 +76,8 @@ def extract_rules(
         result = parse_llm_json_response(response)
         rules = result.get("rules", [])
 
-        # Validate that rules are verbatim
-        rules = validate_verbatim_rules(rules, section_data["text"])
-
-        # Add source metadata and rule_id to each rule
-        for index, rule in enumerate(rules):
-            rule["rule_id"] = f"{section_id}_r{index}"
-            rule["source_section"] = section_id
-            rule["source_page_numbers"] = section_data["page_numbers"]
+        # Validate verbatim text and attach rule_id/source metadata
+        rules = _finalize_rules(section_id, section_data, rules)
 
         # Log token usage
         usage = response.usage
@@ -89,9 +90,7 @@ def extract_rules(
 
         # Cache result (unless ignore_cache flag is set)
         if should_use_cache():
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(rules, f, indent=2, ensure_ascii=False)
+            save_json_file(rules, cache_path)
 
         return rules
 
@@ -101,6 +100,174 @@ def extract_rules(
         return []  # Return empty list, continue with other sections
 
 
+def extract_rules_batch(
+    sections: Dict[str, Dict], client: Optional["OpenAI"] = None
+) -> Dict[str, List[Dict]]:
+    """
+    Extract legal rules from several sections with a single GPT-4.1 call.
+
+    Sections already in the rules cache are served from it. A lone section,
+    and any section the batched response leaves out or returns malformed
+    (or a failed batched call), goes through extract_rules instead.
+
+    Args:
+        sections: Dict of section_id -> section dict with title, text, page_numbers
+        client: OpenAI client (creates new if None)
+
+    Returns:
+        Dict of section_id -> list of rule dicts, in input order
+    """
+    from src.cli.utils import should_use_cache
+    from src.config import RULE_EXTRACTION_BATCH_PROMPT, RULES_BATCH_RESPONSE_FORMAT
+    from src.lib.openai_client import get_openai_client
+
+    if client is None:
+        client = get_openai_client()
+
+    if len(sections) == 1:
+        ((section_id, section_data),) = sections.items()
+        return {section_id: extract_rules(section_id, section_data, client)}
+
+    results = {}
+    pending = {}
+    for section_id, section_data in sections.items():
+        cache_path = Path(f"cache/rules/{section_id}{prompt_cache_suffix()}.json")
+        if should_use_cache() and cache_path.exists():
+            results[section_id] = extract_rules(section_id, section_data, client)
+        else:
+            pending[section_id] = section_data
+
+    if len(pending) > 1:
+        # Build one prompt covering every uncached section, labelled by section ID
+        prompt = render_prompt(
+            RULE_EXTRACTION_BATCH_PROMPT,
+            sections="\n\n".join(
+                f"Section ID: {section_id}\n"
+                f"Section Title: {section_data['title']}\n"
+                f"Section Text:\n{section_data['text']}"
+                for section_id, section_data in pending.items()
+            ),
+        )
+
+        try:
+            response = create_chat_completion(
+                client,
+                model="gpt-4.1",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a legal analyst extracting rules from legal documents. Return valid JSON only.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.1,  # Low temperature for consistency
+                response_format=RULES_BATCH_RESPONSE_FORMAT,
+            )
+
+            from src.pipeline.util import parse_llm_json_response
+
+            result = parse_llm_json_response(response)
+            rules_by_section = {
+                str(entry.get("id")): entry.get("rules", []) for entry in result.get("results", [])
+            }
+
+            # Log token usage for the whole batch
+            usage = response.usage
+            cost = estimate_cost(usage)
+            print(
+                f"  Tokens: {usage.total_tokens} (input: {usage.prompt_tokens}, output: {usage.completion_tokens})"
+            )
+            print(f"  Cost: ${cost:.4f} for {len(pending)} sections")
+        except Exception as e:
+            print(f"  ERROR extracting rules from {', '.join(pending)}: {e}")
+            print("  Retrying these sections one at a time...")
+            rules_by_section = {}
+
+        for section_id, section_data in pending.items():
+            if section_id not in rules_by_section:
+                continue
+            try:
+                rules = _finalize_rules(section_id, section_data, rules_by_section[section_id])
+            except Exception as e:
+                # A malformed entry only costs its own section a single-section retry
+                print(f"  ERROR reading batched rules for {section_id}: {e}")
+                print("  Retrying this section on its own...")
+                continue
+            print(f"  Extracted: {len(rules)} rules from {section_id}")
+
+            # Cache result (unless ignore_cache flag is set)
+            if should_use_cache():
+                cache_path = Path(f"cache/rules/{section_id}{prompt_cache_suffix()}.json")
+                save_json_file(rules, cache_path)
+            results[section_id] = rules
+
+    # Sections the batch did not cover fall back to one call each
+    for section_id, section_data in pending.items():
+        if section_id not in results:
+            results[section_id] = extract_rules(section_id, section_data, client)
+
+    return {section_id: results[section_id] for section_id in sections}
+
+
+def plan_rule_batches(
+    sections: Dict[str, Dict],
+    batch_size: int,
+    token_budget: int = RULE_EXTRACTION_BATCH_TOKEN_BUDGET,
+) -> List[Dict[str, Dict]]:
+    """
+    Group consecutive (sibling) sections into batches for extract_rules_batch.
+
+    A batch closes when it holds batch_size sections or when adding the next
+    section would push its estimated tokens (characters / 4) past token_budget.
+
+    Args:
+        sections: Dict of section_id -> section dict, in document order
+        batch_size: Maximum sections per batch (1 means one call per section)
+        token_budget: Maximum estimated section-text tokens per batch
+
+    Returns:
+        List of section dicts, preserving order
+    """
+    if batch_size <= 1:
+        return [{section_id: section_data} for section_id, section_data in sections.items()]
+
+    batches = []
+    current = {}
+    current_tokens = 0
+    for section_id, section_data in sections.items():
+        tokens = len(section_data["text"]) // 4
+        if current and (len(current) >= batch_size or current_tokens + tokens > token_budget):
+            batches.append(current)
+            current = {}
+            current_tokens = 0
+        current[section_id] = section_data
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _finalize_rules(section_id: str, section_data: Dict, rules: List[Dict]) -> List[Dict]:
+    """Validate verbatim rule text and add rule_id and source metadata.
+
+    Args:
+        section_id: Section identifier the rules were extracted from
+        section_data: Section dict with text and page_numbers
+        rules: Raw rules returned by the model
+
+    Returns:
+        List of rules with rule_id, source_section and source_page_numbers set
+    """
+    rules = validate_verbatim_rules(rules, section_data["text"])
+
+    for index, rule in enumerate(rules):
+        rule["rule_id"] = f"{section_id}_r{index}"
+        rule["source_section"] = section_id
+        rule["source_page_numbers"] = section_data["page_numbers"]
+
+    return rules
+
+
 def estimate_cost(usage) -> float:
     """
     Estimate cost based on token usage.
@@ -1,17 +1,30 @@
 """Question generation from extracted rules using LLM."""
 
-import json
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-from openai import OpenAI
+from src.cli.utils import (
+    load_json_file,
+    load_section_text,
+    prompt_cache_suffix,
+    save_json_file,
+)
+from src.config import LLM_MAX_CONCURRENCY
+from src.pipeline.util import create_chat_completion, render_prompt, utc_timestamp
 
-from src.cli.utils import load_section_text
+# Annotations only; the openai package is slow to import and only needed once a
+# client is created
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# LLM requests in flight across all threads generating questions
+_LLM_SLOTS = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
 
 
 def generate_definitional(
-    rule: Dict, section_id: str, rule_index: int, client: Optional[OpenAI] = None
+    rule: Dict, section_id: str, rule_index: int, client: Optional["OpenAI"] = None
 ) -> Dict:
     """
     Generate a definitional multiple-choice question for a rule.
@@ -25,7 +38,7 @@ def generate_definitional(
     Returns:
         Question dict with full metadata
     """
-    from src.config import DEFINITIONAL_PROMPT
+    from src.config import DEFINITIONAL_PROMPT, MC_QUESTION_RESPONSE_FORMAT
     from src.lib.openai_client import get_openai_client
 
     if client is None:
@@ -35,7 +48,8 @@ def generate_definitional(
     section_text = load_section_text(section_id)
 
     # Build prompt
-    prompt = DEFINITIONAL_PROMPT.format(
+    prompt = render_prompt(
+        DEFINITIONAL_PROMPT,
         rule_text=rule["rule_text"],
         rule_type=rule["rule_type"],
         section_id=section_id,
@@ -43,7 +57,8 @@ def generate_definitional(
     )
 
     # Call API
-    response = client.chat.completions.create(
+    response = create_chat_completion(
+        client,
         model="gpt-4.1",
         messages=[
             {
@@ -53,7 +68,7 @@ def generate_definitional(
             {"role": "user", "content": prompt},
         ],
         temperature=0.3,  # Low for definitional questions
-        response_format={"type": "json_object"},
+        response_format=MC_QUESTION_RESPONSE_FORMAT,
     )
 
     # Parse response
@@ -72,7 +87,7 @@ def generate_definitional(
             "rule_type": rule["rule_type"],
             "footnotes_used": rule.get("footnote_refs", []),
             "generation_model": "gpt-4.1",
-            "generation_timestamp": datetime.utcnow().isoformat(),
+            "generation_timestamp": utc_timestamp(),
             "source_page_numbers": rule.get("source_page_numbers", []),
         },
     }
@@ -81,7 +96,7 @@ def generate_definitional(
 
 
 def generate_scenario(
-    rule: Dict, section_id: str, rule_index: int, difficulty: str, client: Optional[OpenAI] = None
+    rule: Dict, section_id: str, rule_index: int, difficulty: str, client: Optional["OpenAI"] = None
 ) -> Dict:
     """
     Generate a scenario-based multiple-choice question for a rule.
@@ -96,7 +111,12 @@ def generate_scenario(
     Returns:
         Question dict with full metadata
     """
-    from src.config import EASY_SCENARIO_GUIDANCE, HARD_SCENARIO_GUIDANCE, SCENARIO_PROMPT
+    from src.config import (
+        EASY_SCENARIO_GUIDANCE,
+        HARD_SCENARIO_GUIDANCE,
+        MC_QUESTION_RESPONSE_FORMAT,
+        SCENARIO_PROMPT,
+    )
     from src.lib.openai_client import get_openai_client
 
     if client is None:
@@ -109,7 +129,8 @@ def generate_scenario(
     section_text = load_section_text(section_id)
 
     # Build prompt
-    prompt = SCENARIO_PROMPT.format(
+    prompt = render_prompt(
+        SCENARIO_PROMPT,
         difficulty=difficulty,
         rule_text=rule["rule_text"],
         rule_type=rule["rule_type"],
@@ -119,7 +140,8 @@ def generate_scenario(
     )
 
     # Call API
-    response = client.chat.completions.create(
+    response = create_chat_completion(
+        client,
         model="gpt-4.1",
         messages=[
             {
@@ -129,7 +151,7 @@ def generate_scenario(
             {"role": "user", "content": prompt},
         ],
         temperature=0.5,  # Moderate for scenario creativity
-        response_format={"type": "json_object"},
+        response_format=MC_QUESTION_RESPONSE_FORMAT,
     )
 
     # Parse response
@@ -148,7 +170,7 @@ def generate_scenario(
             "rule_type": rule["rule_type"],
             "footnotes_used": rule.get("footnote_refs", []),
             "generation_model": "gpt-4.1",
-            "generation_timestamp": datetime.utcnow().isoformat(),
+            "generation_timestamp": utc_timestamp(),
             "source_page_numbers": rule.get("source_page_numbers", []),
         },
     }
@@ -157,7 +179,7 @@ def generate_scenario(
 
 
 def generate_refusal(
-    rule: Dict, section_id: str, rule_index: int, client: Optional[OpenAI] = None
+    rule: Dict, section_id: str, rule_index: int, client: Optional["OpenAI"] = None
 ) -> Dict:
     """
     Generate a refusal test question for a rule.
@@ -171,7 +193,7 @@ def generate_refusal(
     Returns:
         Question dict with full metadata
     """
-    from src.config import REFUSAL_PROMPT
+    from src.config import REFUSAL_PROMPT, REFUSAL_QUESTION_RESPONSE_FORMAT
     from src.lib.openai_client import get_openai_client
 
     if client is None:
@@ -181,7 +203,8 @@ def generate_refusal(
     section_text = load_section_text(section_id)
 
     # Build prompt
-    prompt = REFUSAL_PROMPT.format(
+    prompt = render_prompt(
+        REFUSAL_PROMPT,
         rule_text=rule["rule_text"],
         rule_type=rule["rule_type"],
         section_id=section_id,
@@ -189,7 +212,8 @@ def generate_refusal(
     )
 
     # Call API
-    response = client.chat.completions.create(
+    response = create_chat_completion(
+        client,
         model="gpt-4.1",
         messages=[
             {
@@ -199,7 +223,7 @@ def generate_refusal(
             {"role": "user", "content": prompt},
         ],
         temperature=0.4,  # Moderate creativity for refusal questions
-        response_format={"type": "json_object"},
+        response_format=REFUSAL_QUESTION_RESPONSE_FORMAT,
     )
 
     # Parse response
@@ -218,7 +242,7 @@ def generate_refusal(
             "rule_type": rule["rule_type"],
             "footnotes_used": rule.get("footnote_refs", []),
             "generation_model": "gpt-4.1",
-            "generation_timestamp": datetime.utcnow().isoformat(),
+            "generation_timestamp": utc_timestamp(),
             "source_page_numbers": rule.get("source_page_numbers", []),
         },
     }
@@ -226,6 +250,16 @@ def generate_refusal(
     return question
 
 
+def _generate_with_llm_slot(generator: Callable[..., Dict], *args) -> Dict:
+    """Run one question generator while holding an LLM slot.
+
+    Rules are generated concurrently and each rule fans out over its question
+    types, so the shared slots keep total requests in flight at LLM_MAX_CONCURRENCY.
+    """
+    with _LLM_SLOTS:
+        return generator(*args)
+
+
 def should_generate_refusal(rule: Dict) -> bool:
     """
     Determine if a refusal question should be generated for this rule.
@@ -246,7 +280,7 @@ def generate_questions_for_rule(
     rule: Dict,
     section_id: str,
     rule_index: int,
-    client: Optional[OpenAI] = None,
+    client: Optional["OpenAI"] = None,
     question_types_filter: Optional[List[str]] = None,
 ) -> List[Dict]:
     """
@@ -272,43 +306,64 @@ def generate_questions_for_rule(
     # Check cache first (only if no filter, since filtering changes output)
     from src.cli.utils import should_use_cache
 
-    cache_path = Path(f"cache/questions/{section_id}_r{rule_index}.json")
+    cache_path = Path(f"cache/questions/{section_id}_r{rule_index}{prompt_cache_suffix()}.json")
     if should_use_cache() and cache_path.exists() and question_types_filter is None:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
+        cached_data = load_json_file(cache_path)
+        # The cache is keyed by rule position, so only reuse questions generated
+        # from this exact rule text (rules may have been re-extracted or reordered)
+        if all(
+            question.get("metadata", {}).get("source_rule") == rule["rule_text"]
+            for question in cached_data
+        ):
             print(f"  [Cached] {len(cached_data)} questions")
             return cached_data
+        print("  [Stale cache] rule text changed, regenerating")
+
+    # Requested question types, as (generator, extra args) in output order
+    tasks = []
+
+    # Generate definitional question if requested
+    if question_types_filter is None or "definitional" in question_types_filter:
+        print("  Generating definitional question...")
+        tasks.append((generate_definitional, ()))
+
+    # Generate scenario (easy) if requested
+    if question_types_filter is None or "scenario_easy" in question_types_filter:
+        print("  Generating scenario (easy) question...")
+        tasks.append((generate_scenario, ("easy",)))
+
+    # Generate scenario (hard) if requested
+    if question_types_filter is None or "scenario_hard" in question_types_filter:
+        print("  Generating scenario (hard) question...")
+        tasks.append((generate_scenario, ("hard",)))
+
+    # Generate refusal if requested and applicable
+    if (
+        question_types_filter is None or "refusal" in question_types_filter
+    ) and should_generate_refusal(rule):
+        print("  Generating refusal question...")
+        tasks.append((generate_refusal, ()))
 
     try:
-        questions = []
-
-        # Generate definitional question if requested
-        if question_types_filter is None or "definitional" in question_types_filter:
-            print("  Generating definitional question...")
-            questions.append(generate_definitional(rule, section_id, rule_index, client))
-
-        # Generate scenario (easy) if requested
-        if question_types_filter is None or "scenario_easy" in question_types_filter:
-            print("  Generating scenario (easy) question...")
-            questions.append(generate_scenario(rule, section_id, rule_index, "easy", client))
-
-        # Generate scenario (hard) if requested
-        if question_types_filter is None or "scenario_hard" in question_types_filter:
-            print("  Generating scenario (hard) question...")
-            questions.append(generate_scenario(rule, section_id, rule_index, "hard", client))
-
-        # Generate refusal if requested and applicable
-        if (
-            question_types_filter is None or "refusal" in question_types_filter
-        ) and should_generate_refusal(rule):
-            print("  Generating refusal question...")
-            questions.append(generate_refusal(rule, section_id, rule_index, client))
+        # The question types are independent calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+            futures = [
+                executor.submit(
+                    _generate_with_llm_slot,
+                    generator,
+                    rule,
+                    section_id,
+                    rule_index,
+                    *extra_args,
+                    client,
+                )
+                for generator, extra_args in tasks
+            ]
+            questions = [future.result() for future in futures]
 
         # Cache results (unless ignore_cache flag is set)
         if should_use_cache():
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(questions, f, indent=2, ensure_ascii=False)
+            save_json_file(questions, cache_path)
 
         print(f"  Generated {len(questions)} questions for rule {rule_index}")
 
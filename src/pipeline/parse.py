@@ -1,10 +1,27 @@
 """PDF parsing for LOAC manual."""
 
-import re
-from typing import Dict, Optional
+import hashlib
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import pdfplumber
 
+from src.cli.utils import load_json_file, save_json_file
+from src.config import (
+    IO_BUFFER_SIZE,
+    PARSE_PAGES_PER_WORKER,
+    SECTION_HEADER_PATTERN,
+    SECTION_HEADER_SEARCH_PATTERN,
+)
+
+# Bump when parser output changes so stale cache/parse entries are not reused
+PARSE_CACHE_VERSION = 1
+
 
 def parse_document(pdf_path: str, section_prefix: Optional[str] = None) -> Dict:
     """
@@ -20,104 +37,148 @@ def parse_document(pdf_path: str, section_prefix: Optional[str] = None) -> Dict:
     - Full text content (excluding footnotes at bottom of pages)
     - Footnote references and content
     - Page numbers
+
+    Results are cached in cache/parse/ keyed by a hash of the PDF contents and
+    section_prefix, so re-running on an unchanged PDF skips parsing entirely.
+    """
+    from src.cli.utils import should_use_cache
+
+    if not should_use_cache():
+        return _parse_pdf(pdf_path, section_prefix)
+
+    # Check cache first
+    cache_path = Path(f"cache/parse/{_parse_cache_key(pdf_path, section_prefix)}.json")
+    if cache_path.exists():
+        sections = load_json_file(cache_path)
+        print(f"  [Cached] {len(sections)} sections")
+        return sections
+
+    sections = _parse_pdf(pdf_path, section_prefix)
+
+    # Cache result
+    save_json_file(sections, cache_path)
+
+    return sections
+
+
+def _parse_cache_key(pdf_path: str, section_prefix: Optional[str]) -> str:
     """
+    Build the parse cache key from the PDF contents and parse options.
+
+    The PDF is hashed in 64 KiB chunks read into a reused buffer.
+    """
+    digest = hashlib.sha256(f"v{PARSE_CACHE_VERSION}:{section_prefix or ''}:".encode())
+    buf = bytearray(1 << 16)
+    view = memoryview(buf)
+    with open(pdf_path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _parse_pdf(pdf_path: str, section_prefix: Optional[str] = None) -> Dict:
+    """Parse PDF into sections (uncached implementation of parse_document)."""
     sections = {}
     current_section_id = None
     current_section_text = []
     current_section_title = None
-    current_section_pages = set()
-
-    # Pattern to match section headers: number followed by any text
-    # Capitalization-agnostic, accepts any punctuation or none
-    section_header_pattern = re.compile(r"^\s*(\d+(?:\.\d+)+)\s+(.+?)\s*$")
-
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            # Find horizontal rule that separates main text from footnotes
-            footnote_separator_y = _find_footnote_separator(page)
-
-            # Extract text, cropping to exclude footnotes if separator found
-            if footnote_separator_y is not None:
-                # Crop page to above separator
-                bbox = (0, 0, page.width, footnote_separator_y)
-                cropped = page.crop(bbox)
-                text = cropped.extract_text()
-            else:
-                # No separator found, use full page
-                text = page.extract_text()
-
-            if not text:
+    # Pages arrive in order, so an append-if-new list stays sorted and unique
+    current_section_pages = []
+
+    for page_num, text in enumerate(_extract_page_texts(pdf_path), start=1):
+        if not text:
+            continue
+
+        # Everything above the page's first header continues the current section,
+        # so it is appended in bulk; only lines from the first header on need
+        # header and title-continuation handling
+        first_header = SECTION_HEADER_SEARCH_PATTERN.search(text)
+        body_end = first_header.start() if first_header else len(text)
+        if current_section_id:
+            body = [line for line in map(str.strip, text[:body_end].split("\n")) if line]
+            if body:
+                current_section_text.extend(body)
+                if current_section_pages[-1] != page_num:
+                    current_section_pages.append(page_num)
+        if first_header is None:
+            continue
+
+        lines = text[body_end:].split("\n")
+
+        i = 0
+        while i < len(lines):
+            line = lines[i].strip()
+            if not line:
+                i += 1
                 continue
 
-            lines = text.split("\n")
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                if not line:
-                    i += 1
-                    continue
-
-                # Check if this line starts a section header
-                match = section_header_pattern.match(line)
-                if match:
-                    # Save previous section if exists
-                    if current_section_id:
-                        sections[current_section_id] = {
-                            "title": current_section_title,
-                            "text": "\n".join(current_section_text).strip(),
-                            "page_numbers": sorted(list(current_section_pages)),
-                        }
-
-                    # Start new section
-                    current_section_id = match.group(1)
-                    title = match.group(2).strip()
-
-                    # Determine section depth (count dots)
-                    section_depth = current_section_id.count(".")
-
-                    # Level 3+ sections (e.g., 5.5.1): multi-line, period-terminated
-                    # Level 2 sections (e.g., 5.5): single-line, all caps, no period
-                    if section_depth >= 2:
-                        # Check if next line is title continuation
-                        if i + 1 < len(lines):
-                            next_line = lines[i + 1].strip()
-                            if next_line and not section_header_pattern.match(next_line):
-                                # If next line has a period, split on it
-                                if "." in next_line:
-                                    period_idx = next_line.index(".")
-                                    title = title + " " + next_line[: period_idx + 1]
-                                    # Put the remainder back for processing as section text
-                                    remainder = next_line[period_idx + 1 :].strip()
-                                    if remainder:
-                                        lines[i + 1] = remainder
-                                        # Don't increment i - let outer loop process the remainder
-                                    else:
-                                        i += 1  # Skip empty line after period
+            # Check if this line starts a section header (headers open with a
+            # digit, so most prose lines skip the regex)
+            match = SECTION_HEADER_PATTERN.match(line) if line[0].isdigit() else None
+            if match:
+                # Save previous section if exists
+                if current_section_id:
+                    sections[current_section_id] = {
+                        "title": current_section_title,
+                        "text": "\n".join(current_section_text).strip(),
+                        "page_numbers": current_section_pages,
+                    }
+
+                # Start new section
+                current_section_id = match.group(1)
+                title = match.group(2).strip()
+
+                # Determine section depth (count dots)
+                section_depth = current_section_id.count(".")
+
+                # Level 3+ sections (e.g., 5.5.1): multi-line, period-terminated
+                # Level 2 sections (e.g., 5.5): single-line, all caps, no period
+                if section_depth >= 2:
+                    # Check if next line is title continuation
+                    if i + 1 < len(lines):
+                        next_line = lines[i + 1].strip()
+                        if next_line and not (
+                            next_line[0].isdigit() and SECTION_HEADER_PATTERN.match(next_line)
+                        ):
+                            # If next line has a period, split on it
+                            if "." in next_line:
+                                period_idx = next_line.index(".")
+                                title = title + " " + next_line[: period_idx + 1]
+                                # Put the remainder back for processing as section text
+                                remainder = next_line[period_idx + 1 :].strip()
+                                if remainder:
+                                    lines[i + 1] = remainder
+                                    # Don't increment i - let outer loop process the remainder
                                 else:
-                                    # No period, just append whole line
-                                    title = title + " " + next_line
-                                    i += 1  # Move past the line we consumed
-
-                    # Remove trailing period if present
-                    current_section_title = title.rstrip(".")
-                    current_section_text = []
-                    current_section_pages = {page_num}
-                else:
-                    # Add to current section text
-                    if current_section_id:
-                        current_section_text.append(line)
-                        current_section_pages.add(page_num)
-
-                i += 1
-
-        # Save last section
-        if current_section_id:
-            sections[current_section_id] = {
-                "title": current_section_title,
-                "text": "\n".join(current_section_text).strip(),
-                "page_numbers": sorted(list(current_section_pages)),
-            }
+                                    i += 1  # Skip empty line after period
+                            else:
+                                # No period, just append whole line
+                                title = title + " " + next_line
+                                i += 1  # Move past the line we consumed
+
+                # Remove trailing period if present
+                current_section_title = title.rstrip(".")
+                current_section_text = []
+                current_section_pages = [page_num]
+            else:
+                # Add to current section text
+                if current_section_id:
+                    current_section_text.append(line)
+                    if current_section_pages[-1] != page_num:
+                        current_section_pages.append(page_num)
+
+            i += 1
+
+    # Save last section
+    if current_section_id:
+        sections[current_section_id] = {
+            "title": current_section_title,
+            "text": "\n".join(current_section_text).strip(),
+            "page_numbers": current_section_pages,
+        }
 
     # Filter sections by prefix if specified
     if section_prefix:
@@ -133,6 +194,69 @@ def parse_document(pdf_path: str, section_prefix: Optional[str] = None) -> Dict:
     return sections
 
 
+def _extract_page_texts(pdf_path: str) -> List[Optional[str]]:
+    """
+    Extract the main (non-footnote) text of every page, in page order.
+
+    Laying out a page in pdfminer is pure-Python and CPU-bound, so longer PDFs
+    are split into contiguous page ranges extracted in worker processes (one
+    per PARSE_PAGES_PER_WORKER pages, up to the CPU count). Short PDFs are
+    extracted in-process.
+
+    Workers are spawned rather than forked: callers such as cmd_all may have other
+    threads running (e.g. building the OpenAI client), and forking a multi-threaded
+    process can deadlock on a lock another thread held. Workers reopen the PDF by
+    path, so they need nothing from the parent's memory.
+    """
+    # Hand pdfplumber a file with a large read buffer to cut syscalls on its many small reads
+    with (
+        open(pdf_path, "rb", buffering=IO_BUFFER_SIZE) as pdf_file,
+        pdfplumber.open(pdf_file) as pdf,
+    ):
+        page_count = len(pdf.pages)
+        workers = min(os.cpu_count() or 1, page_count // PARSE_PAGES_PER_WORKER)
+        if workers <= 1:
+            return [_extract_main_text(page) for page in pdf.pages]
+
+    pages_per_worker = -(-page_count // workers)  # ceiling division
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [
+            executor.submit(
+                _extract_page_range,
+                pdf_path,
+                list(range(first, min(first + pages_per_worker, page_count + 1))),
+            )
+            for first in range(1, page_count + 1, pages_per_worker)
+        ]
+        return list(chain.from_iterable(future.result() for future in futures))
+
+
+def _extract_page_range(pdf_path: str, page_numbers: List[int]) -> List[Optional[str]]:
+    """Extract main text for the given 1-based pages (runs in a worker process)."""
+    with (
+        open(pdf_path, "rb", buffering=IO_BUFFER_SIZE) as pdf_file,
+        pdfplumber.open(pdf_file, pages=page_numbers) as pdf,
+    ):
+        return [_extract_main_text(page) for page in pdf.pages]
+
+
+def _extract_main_text(page) -> Optional[str]:
+    """Extract a page's text above the footnote separator (whole page if there is none)."""
+    # Find horizontal rule that separates main text from footnotes
+    footnote_separator_y = _find_footnote_separator(page)
+
+    # Extract text, cropping to exclude footnotes if separator found
+    if footnote_separator_y is not None:
+        # Crop page to above separator
+        bbox = (0, 0, page.width, footnote_separator_y)
+        return page.crop(bbox).extract_text()
+
+    # No separator found, use full page
+    return page.extract_text()
+
+
 def _find_footnote_separator(page) -> Optional[float]:
     """
     Find the horizontal rule that separates main text from footnotes.
@@ -146,13 +270,15 @@ def _find_footnote_separator(page) -> Optional[float]:
         return None
 
     # The footnote separator is exactly 140px wide on every page
-    # (wider lines are underlines/decorations)
+    # (wider lines are underlines/decorations). Its Y position follows the
+    # footnote length, so it cannot be reused across pages; instead test the
+    # most selective condition (width) first and short-circuit the rest.
     for rect in rects:
-        is_thin = rect["height"] < 5
-        is_black = rect.get("non_stroking_color", rect.get("stroking_color")) == 0
-        is_footnote_separator = abs(rect["width"] - 140.0) < 1  # 140px ±1px tolerance
-
-        if is_thin and is_black and is_footnote_separator:
+        if (
+            abs(rect["width"] - 140.0) < 1  # 140px ±1px tolerance
+            and rect["height"] < 5
+            and rect.get("non_stroking_color", rect.get("stroking_color")) == 0
+        ):
             # Found the footnote separator
             return rect["top"]
 
@@ -161,24 +287,16 @@ def _find_footnote_separator(page) -> Optional[float]:
 
 def _add_hierarchy(sections: Dict) -> Dict:
     """Add parent and children fields to create hierarchy."""
-    for section_id in sections.keys():
-        # Determine parent (e.g., "5.5.1.1" -> parent is "5.5.1")
-        parts = section_id.split(".")
-        if len(parts) > 2:  # Has a parent beyond root
-            parent_id = ".".join(parts[:-1])
-            sections[section_id]["parent"] = parent_id
-        elif len(parts) == 2:
-            # Top level section like "5.5"
-            sections[section_id]["parent"] = parts[0]
-
-        # Find children
-        children = []
-        for other_id in sections.keys():
-            other_parts = other_id.split(".")
-            # Check if other_id is a direct child
-            if len(other_parts) == len(parts) + 1 and other_id.startswith(section_id + "."):
-                children.append(other_id)
-
-        sections[section_id]["children"] = sorted(children)
+    # One pass: each section's parent is its ID minus the last component
+    # (e.g., "5.5.1.1" -> "5.5.1", top level "5.5" -> "5"), grouped by parent
+    children_of = defaultdict(list)
+    for section_id, section_data in sections.items():
+        parent_id, dot, _ = section_id.rpartition(".")
+        if dot:
+            section_data["parent"] = parent_id
+            children_of[parent_id].append(section_id)
+
+    for section_id, section_data in sections.items():
+        section_data["children"] = sorted(children_of.get(section_id, ()))
 
     return sections
@@ -1,8 +1,8 @@
 """Deterministic scoring of evaluation responses."""
 
-import json
-from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+from src.cli.utils import save_json_file
 
 
 def score_mc_question(evaluation_result: Dict) -> Dict:
@@ -64,60 +64,57 @@ def calculate_summary_statistics(scored_results: List[Dict]) -> Dict:
     Returns:
         Dict with detailed statistics
     """
-    # Separate by question type
-    by_type = {
-        "definitional": [],
-        "scenario_easy": [],
-        "scenario_hard": [],
-        "refusal": [],
-    }
+    # Tally totals and correct answers per type in a single pass
+    totals = {"definitional": 0, "scenario_easy": 0, "scenario_hard": 0, "refusal": 0}
+    correct = dict.fromkeys(totals, 0)
 
     for result in scored_results:
         qtype = result["question_type"]
-        by_type[qtype].append(result)
+        totals[qtype] += 1
+        if result["correct"]:
+            correct[qtype] += 1
 
-    # Calculate accuracy for each type
-    def accuracy(results):
-        if not results:
-            return 0.0
-        correct_count = sum(1 for r in results if r["correct"])
-        return correct_count / len(results)
+    def accuracy(correct_count, total):
+        return correct_count / total if total else 0.0
+
+    overall_correct = sum(correct.values())
+    easy_accuracy = accuracy(correct["scenario_easy"], totals["scenario_easy"])
+    hard_accuracy = accuracy(correct["scenario_hard"], totals["scenario_hard"])
 
     stats = {
         "overall": {
             "total": len(scored_results),
-            "correct": sum(1 for r in scored_results if r["correct"]),
-            "accuracy": accuracy(scored_results),
+            "correct": overall_correct,
+            "accuracy": accuracy(overall_correct, len(scored_results)),
         },
         "by_type": {
             qtype: {
-                "total": len(results),
-                "correct": sum(1 for r in results if r["correct"]),
-                "accuracy": accuracy(results),
+                "total": total,
+                "correct": correct[qtype],
+                "accuracy": accuracy(correct[qtype], total),
             }
-            for qtype, results in by_type.items()
+            for qtype, total in totals.items()
         },
         "difficulty_comparison": {
-            "easy_accuracy": accuracy(by_type["scenario_easy"]),
-            "hard_accuracy": accuracy(by_type["scenario_hard"]),
-            "difficulty_gap": accuracy(by_type["scenario_easy"])
-            - accuracy(by_type["scenario_hard"]),
+            "easy_accuracy": easy_accuracy,
+            "hard_accuracy": hard_accuracy,
+            "difficulty_gap": easy_accuracy - hard_accuracy,
         },
         "refusal_analysis": {
-            "total_refusal_questions": len(by_type["refusal"]),
-            "properly_refused": sum(1 for r in by_type["refusal"] if r["correct"]),
-            "refusal_rate": accuracy(by_type["refusal"]),
+            "total_refusal_questions": totals["refusal"],
+            "properly_refused": correct["refusal"],
+            "refusal_rate": accuracy(correct["refusal"], totals["refusal"]),
         },
     }
 
     return stats
 
 
-def analyze_confusion(scored_mc_results: List[Dict]) -> Dict:
+def analyze_confusion(scored_mc_results: Iterable[Dict]) -> Dict:
     """Analyze which wrong answers were selected.
 
     Args:
-        scored_mc_results: List of scored MC question results
+        scored_mc_results: Scored MC question results (iterated once)
 
     Returns:
         Dict with confusion analysis
@@ -210,11 +207,12 @@ def generate_analysis_report(summary: Dict, confusion: Dict) -> str:
     return "\n".join(lines)
 
 
-def score_evaluation(evaluation_responses: List[Dict]) -> Dict:
+def score_evaluation(evaluation_responses: Iterable[Dict]) -> Dict:
     """Score all evaluation responses.
 
     Args:
-        evaluation_responses: List of evaluation results from Phase 6
+        evaluation_responses: Evaluation results from Phase 6; iterated once, so a
+            streaming reader works as well as a list
 
     Returns:
         Dict with scored results and summary statistics
@@ -249,8 +247,4 @@ def save_scored_results(scoring_output: Dict, output_path: str):
         scoring_output: Full scoring output dict
         output_path: Path to save JSON file
     """
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(scoring_output, f, indent=2, ensure_ascii=False)
+    save_json_file(scoring_output, output_path)
@@ -1,11 +1,135 @@
-"""Shared utilities for pipeline operations: LLM response parsing, logging."""
+"""Shared utilities for pipeline operations: LLM calls and response parsing, logging."""
 
-import json
+import functools
+import keyword
+import string
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from types import CodeType
 from typing import Optional
 
-# Import global flags from CLI
-from src.cli.utils import DRY_RUN_MODE, VERBOSE_MODE
+import orjson
+
+# Global flags live on the CLI utils module; read them at call time, since
+# main() sets them after this module has been imported
+import src.cli.utils as cli_utils
+from src.config import COMPACT_PROMPTS, LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE
+
+# Globals for rendering compiled prompt templates: placeholders resolve only
+# against the caller's fields, never builtins
+_NO_BUILTINS = {"__builtins__": {}}
+
+
+class RateLimiter:
+    """Token-bucket throttle on requests and tokens per minute, shared across threads.
+
+    Each bucket holds at most one minute's quota and refills continuously, so
+    bursts up to the quota go straight through and sustained load is paced to it.
+    A limit of None disables that bucket.
+    """
+
+    def __init__(
+        self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request and the given tokens fit the budget, then take them.
+
+        Args:
+            tokens: Estimated tokens the request will use
+        """
+        if not (self.requests_per_minute or self.tokens_per_minute):
+            return
+        if self.tokens_per_minute:
+            # A request larger than the whole quota waits for a full bucket, not forever
+            tokens = min(tokens, self.tokens_per_minute)
+
+        while True:
+            with self._lock:
+                self._refill()
+                wait = 0.0
+                if self.requests_per_minute and self._requests < 1:
+                    wait = (1 - self._requests) * 60 / self.requests_per_minute
+                if self.tokens_per_minute and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+                if not wait:
+                    if self.requests_per_minute:
+                        self._requests -= 1
+                    if self.tokens_per_minute:
+                        self._tokens -= tokens
+                    return
+            time.sleep(wait)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Charge (or refund) the difference between estimated and reported token usage.
+
+        Args:
+            estimated_tokens: Tokens taken by acquire() for the request
+            actual_tokens: Total tokens the API reported for it
+        """
+        if self.tokens_per_minute:
+            with self._lock:
+                self._tokens -= actual_tokens - estimated_tokens
+
+
+# One limiter for every LLM call in the process (disabled unless limits are configured)
+_rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
+
+
+def create_chat_completion(client, **request):
+    """Call client.chat.completions.create, throttled to the configured rate limits.
+
+    The request's tokens are estimated as message characters / 4 up front and
+    reconciled with the reported usage afterwards.
+
+    Args:
+        client: OpenAI client
+        **request: Keyword arguments for chat.completions.create
+
+    Returns:
+        ChatCompletion response
+    """
+    estimated_tokens = sum(len(message["content"]) for message in request["messages"]) // 4
+    _rate_limiter.acquire(estimated_tokens)
+    response = client.chat.completions.create(**request)
+    total_tokens = getattr(getattr(response, "usage", None), "total_tokens", None)
+    if isinstance(total_tokens, int):
+        _rate_limiter.record_usage(estimated_tokens, total_tokens)
+    return response
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string without offset.
+
+    Same format datetime.utcnow().isoformat() produced (deprecated since Python 3.12),
+    so new records match existing cached ones.
+
+    Returns:
+        Timestamp such as "2025-01-31T12:34:56.789012"
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
 
 
 def parse_llm_json_response(response) -> dict:
@@ -18,9 +142,59 @@ def parse_llm_json_response(response) -> dict:
         Parsed JSON dict
 
     Raises:
-        json.JSONDecodeError: If response is not valid JSON
+        json.JSONDecodeError: If response is not valid JSON (orjson's error subclasses it)
+    """
+    return orjson.loads(response.choices[0].message.content)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> CodeType:
+    """Compile a str.format template into an f-string expression once.
+
+    Args:
+        template: Prompt template with plain {field} placeholders
+
+    Returns:
+        Code object that renders the template from locals named after its fields
+
+    Raises:
+        ValueError: If a placeholder is not a bare identifier (no index,
+            attribute, format spec or conversion)
+    """
+    for _, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is None:
+            continue
+        bare = field_name.isidentifier() and not keyword.iskeyword(field_name)
+        if not bare or format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {{{field_name}}}")
+    # f-strings share str.format's brace escaping, so the template is valid as-is
+    return compile("f" + repr(template), "<prompt template>", "eval")
+
+
+def render_prompt(template: str, **fields) -> str:
+    """Fill a prompt template; equivalent to template.format(**fields).
+
+    The template is compiled once into an f-string, so rendering the same
+    kilobyte-scale prompt repeatedly costs about as much as an f-string.
+    Under --compact-prompts, templates with a compact variant are swapped for it.
+
+    Args:
+        template: Prompt template with plain {field} placeholders
+        **fields: Values for the placeholders
+
+    Returns:
+        Rendered prompt
+
+    Raises:
+        KeyError: If a placeholder has no value in fields
     """
-    return json.loads(response.choices[0].message.content)
+    if cli_utils.COMPACT_PROMPT_MODE:
+        template = COMPACT_PROMPTS.get(template, template)
+    try:
+        return eval(_compile_template(template), _NO_BUILTINS, fields)
+    except NameError as e:
+        # NameError.name is only set on Python 3.10+
+        raise KeyError(getattr(e, "name", None) or str(e)) from None
 
 
 def log_llm_call(
@@ -39,28 +213,24 @@ def log_llm_call(
         tokens: Token count (optional)
         cost: Estimated cost in USD (optional)
     """
-    if not (VERBOSE_MODE or DRY_RUN_MODE):
+    if not (cli_utils.VERBOSE_MODE or cli_utils.DRY_RUN_MODE):
         return
 
-    # Full prompt in verbose mode (no truncation)
-    prompt_preview = prompt
-
-    print("=" * 80, file=sys.stderr)
-    print(f"LLM CALL: {model}", file=sys.stderr)
-    print("-" * 80, file=sys.stderr)
-    print("PROMPT:", file=sys.stderr)
-    print(prompt_preview, file=sys.stderr)
+    # Full prompt in verbose mode (no truncation); buffered into one write
+    # so concurrent calls take the stderr lock once and don't interleave
+    rule, thin_rule = "=" * 80, "-" * 80
+    out = [rule, f"LLM CALL: {model}", thin_rule, "PROMPT:", prompt]
 
     if response:
-        print("-" * 80, file=sys.stderr)
-        print("RESPONSE:", file=sys.stderr)
-        print(response, file=sys.stderr)
+        out.extend((thin_rule, "RESPONSE:", response))
 
     if tokens or cost:
-        print("-" * 80, file=sys.stderr)
+        out.append(thin_rule)
         if tokens:
-            print(f"Tokens: {tokens}", file=sys.stderr)
+            out.append(f"Tokens: {tokens}")
         if cost:
-            print(f"Estimated cost: ${cost:.4f}", file=sys.stderr)
+            out.append(f"Estimated cost: ${cost:.4f}")
 
-    print("=" * 80, file=sys.stderr)
+    out.append(rule)
+    out.append("")
+    sys.stderr.write("\n".join(out))
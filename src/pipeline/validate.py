@@ -1,12 +1,102 @@
 """Question validation and quality control."""
 
 import json
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from src.cli.utils import (
+    load_json_file,
+    load_section_text,
+    prompt_cache_suffix,
+    save_json_file,
+)
+from src.config import LLM_MAX_CONCURRENCY, VALIDATION_CONTEXT_PROMPT
+from src.pipeline.util import create_chat_completion, render_prompt
+
+# Annotations only; the openai package is slow to import and only needed once a
+# client is created
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Histogram labels for the validation analysis report (0-9 ... 90-99, then exactly 100)
+DECILE_LABELS = [
+    "  0-9",
+    " 10-19",
+    " 20-29",
+    " 30-39",
+    " 40-49",
+    " 50-59",
+    " 60-69",
+    " 70-79",
+    " 80-89",
+    " 90-99",
+    "  100",
+]
+
+# Validation cache filename suffix (before the prompt-mode suffix and .json)
+# -> (analysis component, score field)
+VALIDATION_CACHE_COMPONENTS = (
+    ("_question_entailment", "Question Entailment", "confidence"),
+    ("_answer_entailment", "Answer Entailment", "confidence"),
+    ("_distractors", "Distractor Quality", "quality_score"),
+    ("_refusal", "Refusal Appropriateness", "appropriateness_score"),
+)
+
+# Thread pool size for reading validation cache files in the analysis report
+CACHE_LOAD_WORKERS = 16
+
+# Structural validation schema (checked for every question, so built once here)
+REQUIRED_QUESTION_FIELDS = ("question_id", "question_type", "question", "confidence", "metadata")
+MC_QUESTION_TYPES = ("definitional", "scenario_easy", "scenario_hard")
+VALID_QUESTION_TYPES = MC_QUESTION_TYPES + ("refusal",)
+REQUIRED_METADATA_FIELDS = (
+    "source_section",
+    "source_rule",
+    "rule_type",
+    "footnotes_used",
+    "generation_model",
+    "generation_timestamp",
+    "source_page_numbers",
+)
+
+VALIDATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a legal expert validating question quality. Return valid JSON only.",
+}
+
+
+def _validation_messages(question: Dict, section_text: str, prompt: str) -> List[Dict]:
+    """
+    Build the chat messages for one LLM validation check.
 
-from openai import OpenAI
+    The system message and the section/rule context come first and are identical
+    for every check of the same rule, so OpenAI's automatic prompt caching can
+    reuse that prefix across them; the check-specific prompt follows.
 
-from src.cli.utils import load_section_text
+    Args:
+        question: Question dict with metadata.source_rule
+        section_text: Text of the question's source section
+        prompt: Rendered check-specific validation prompt
+
+    Returns:
+        Messages list for chat.completions.create
+    """
+    context = render_prompt(
+        VALIDATION_CONTEXT_PROMPT,
+        section_text=section_text,
+        source_rule=question["metadata"]["source_rule"],
+    )
+    return [
+        VALIDATION_SYSTEM_MESSAGE,
+        {"role": "user", "content": context},
+        {"role": "user", "content": prompt},
+    ]
 
 
 def validate_structure(question: Dict, parsed_sections: Dict) -> Tuple[bool, List[str]]:
@@ -25,21 +115,19 @@ def validate_structure(question: Dict, parsed_sections: Dict) -> Tuple[bool, Lis
     issues = []
 
     # Required fields for all questions
-    required_fields = ["question_id", "question_type", "question", "confidence", "metadata"]
-    for field in required_fields:
+    for field in REQUIRED_QUESTION_FIELDS:
         if field not in question:
             issues.append(f"Missing required field: {field}")
 
     # Check question type
-    valid_types = ["definitional", "scenario_easy", "scenario_hard", "refusal"]
-    if "question_type" in question and question["question_type"] not in valid_types:
+    if "question_type" in question and question["question_type"] not in VALID_QUESTION_TYPES:
         issues.append(f"Invalid question_type: {question['question_type']}")
 
     # Type-specific validation
     if "question_type" in question:
         qtype = question["question_type"]
 
-        if qtype in ["definitional", "scenario_easy", "scenario_hard"]:
+        if qtype in MC_QUESTION_TYPES:
             # Multiple-choice questions
             if "correct_answer" not in question:
                 issues.append("MC question missing correct_answer")
@@ -60,16 +148,7 @@ def validate_structure(question: Dict, parsed_sections: Dict) -> Tuple[bool, Lis
     # Metadata validation
     if "metadata" in question:
         metadata = question["metadata"]
-        required_metadata = [
-            "source_section",
-            "source_rule",
-            "rule_type",
-            "footnotes_used",
-            "generation_model",
-            "generation_timestamp",
-            "source_page_numbers",
-        ]
-        for field in required_metadata:
+        for field in REQUIRED_METADATA_FIELDS:
             if field not in metadata:
                 issues.append(f"Missing metadata field: {field}")
 
@@ -88,7 +167,7 @@ def validate_structure(question: Dict, parsed_sections: Dict) -> Tuple[bool, Lis
     return (len(issues) == 0, issues)
 
 
-def validate_question_entailment(question: Dict, client: Optional[OpenAI] = None) -> Dict:
+def validate_question_entailment(question: Dict, client: Optional["OpenAI"] = None) -> Dict:
     """
     Validate that the question itself is entailed by (grounded in) the source rule.
 
@@ -109,32 +188,27 @@ def validate_question_entailment(question: Dict, client: Optional[OpenAI] = None
         client = get_openai_client()
 
     # Check cache first
-    cache_path = Path(f"cache/validation/{question['question_id']}_question_entailment.json")
+    cache_path = Path(
+        f"cache/validation/{question['question_id']}_question_entailment{prompt_cache_suffix()}.json"
+    )
     if cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(cache_path)
 
     # Load section text for context
     section_id = question["metadata"]["source_section"]
     section_text = load_section_text(section_id)
 
     # Build prompt
-    prompt = QUESTION_ENTAILMENT_VALIDATION_PROMPT.format(
-        source_rule=question["metadata"]["source_rule"],
+    prompt = render_prompt(
+        QUESTION_ENTAILMENT_VALIDATION_PROMPT,
         question=question["question"],
-        section_text=section_text,
     )
 
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4.1",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a legal expert validating question quality. Return valid JSON only.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=_validation_messages(question, section_text, prompt),
             temperature=0.1,  # Low for consistent validation
             response_format={"type": "json_object"},
         )
@@ -144,9 +218,7 @@ def validate_question_entailment(question: Dict, client: Optional[OpenAI] = None
         result = parse_llm_json_response(response)
 
         # Cache result
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        save_json_file(result, cache_path)
 
         return result
 
@@ -154,7 +226,7 @@ def validate_question_entailment(question: Dict, client: Optional[OpenAI] = None
         return {"error": str(e)}
 
 
-def validate_answer_entailment(question: Dict, client: Optional[OpenAI] = None) -> Dict:
+def validate_answer_entailment(question: Dict, client: Optional["OpenAI"] = None) -> Dict:
     """
     Validate that the correct answer is entailed by the source rule.
 
@@ -178,33 +250,28 @@ def validate_answer_entailment(question: Dict, client: Optional[OpenAI] = None)
         return {"skipped": True, "reason": "Not a multiple-choice question"}
 
     # Check cache first
-    cache_path = Path(f"cache/validation/{question['question_id']}_answer_entailment.json")
+    cache_path = Path(
+        f"cache/validation/{question['question_id']}_answer_entailment{prompt_cache_suffix()}.json"
+    )
     if cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(cache_path)
 
     # Load section text for context
     section_id = question["metadata"]["source_section"]
     section_text = load_section_text(section_id)
 
     # Build prompt
-    prompt = ANSWER_ENTAILMENT_VALIDATION_PROMPT.format(
-        source_rule=question["metadata"]["source_rule"],
+    prompt = render_prompt(
+        ANSWER_ENTAILMENT_VALIDATION_PROMPT,
         question=question["question"],
         answer=question["correct_answer"],
-        section_text=section_text,
     )
 
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4.1",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a legal expert validating question quality. Return valid JSON only.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=_validation_messages(question, section_text, prompt),
             temperature=0.1,  # Low for consistent validation
             response_format={"type": "json_object"},
         )
@@ -214,9 +281,7 @@ def validate_answer_entailment(question: Dict, client: Optional[OpenAI] = None)
         result = parse_llm_json_response(response)
 
         # Cache result
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        save_json_file(result, cache_path)
 
         return result
 
@@ -224,7 +289,7 @@ def validate_answer_entailment(question: Dict, client: Optional[OpenAI] = None)
         return {"error": str(e)}
 
 
-def validate_distractors(question: Dict, client: Optional[OpenAI] = None) -> List[Dict]:
+def validate_distractors(question: Dict, client: Optional["OpenAI"] = None) -> List[Dict]:
     """
     Validate quality of all distractors for a multiple-choice question.
 
@@ -248,36 +313,37 @@ def validate_distractors(question: Dict, client: Optional[OpenAI] = None) -> Lis
         return []
 
     # Check cache first
-    cache_path = Path(f"cache/validation/{question['question_id']}_distractors.json")
+    cache_path = Path(
+        f"cache/validation/{question['question_id']}_distractors{prompt_cache_suffix()}.json"
+    )
     if cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(cache_path)
 
     # Load section text for context
     section_id = question["metadata"]["source_section"]
     section_text = load_section_text(section_id)
 
     results = []
+    # Identical distractor texts get one LLM call; later copies reuse its verdict
+    seen = {}
 
     for i, distractor in enumerate(question["incorrect_answers"]):
-        prompt = DISTRACTOR_VALIDATION_PROMPT.format(
-            source_rule=question["metadata"]["source_rule"],
+        if distractor in seen:
+            results.append({**seen[distractor], "distractor_index": i})
+            continue
+
+        prompt = render_prompt(
+            DISTRACTOR_VALIDATION_PROMPT,
             question=question["question"],
             correct_answer=question["correct_answer"],
             distractor=distractor,
-            section_text=section_text,
         )
 
         try:
-            response = client.chat.completions.create(
+            response = create_chat_completion(
+                client,
                 model="gpt-4.1",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal expert validating question quality. Return valid JSON only.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_validation_messages(question, section_text, prompt),
                 temperature=0.1,
                 response_format={"type": "json_object"},
             )
@@ -288,19 +354,18 @@ def validate_distractors(question: Dict, client: Optional[OpenAI] = None) -> Lis
             result["distractor"] = distractor
             result["distractor_index"] = i
             results.append(result)
+            seen[distractor] = result
 
         except Exception as e:
             results.append({"distractor": distractor, "distractor_index": i, "error": str(e)})
 
     # Cache results
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    save_json_file(results, cache_path)
 
     return results
 
 
-def validate_refusal(question: Dict, client: Optional[OpenAI] = None) -> Dict:
+def validate_refusal(question: Dict, client: Optional["OpenAI"] = None) -> Dict:
     """
     Validate that a refusal question is appropriate for refusal testing.
 
@@ -322,32 +387,27 @@ def validate_refusal(question: Dict, client: Optional[OpenAI] = None) -> Dict:
         return {"skipped": True, "reason": "Not a refusal question"}
 
     # Check cache first
-    cache_path = Path(f"cache/validation/{question['question_id']}_refusal.json")
+    cache_path = Path(
+        f"cache/validation/{question['question_id']}_refusal{prompt_cache_suffix()}.json"
+    )
     if cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(cache_path)
 
     # Load section text for context
     section_id = question["metadata"]["source_section"]
     section_text = load_section_text(section_id)
 
-    prompt = REFUSAL_VALIDATION_PROMPT.format(
-        source_rule=question["metadata"]["source_rule"],
+    prompt = render_prompt(
+        REFUSAL_VALIDATION_PROMPT,
         question=question["question"],
         refusal_reason=question["refusal_reason"],
-        section_text=section_text,
     )
 
     try:
-        response = client.chat.completions.create(
+        response = create_chat_completion(
+            client,
             model="gpt-4.1",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a legal expert validating question quality. Return valid JSON only.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=_validation_messages(question, section_text, prompt),
             temperature=0.1,
             response_format={"type": "json_object"},
         )
@@ -357,9 +417,7 @@ def validate_refusal(question: Dict, client: Optional[OpenAI] = None) -> Dict:
         result = parse_llm_json_response(response)
 
         # Cache result
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        save_json_file(result, cache_path)
 
         return result
 
@@ -439,7 +497,7 @@ def calculate_quality_score(
     components["question_confidence"] = question_confidence
 
     # Type-specific components
-    if question["question_type"] in ["definitional", "scenario_easy", "scenario_hard"]:
+    if question["question_type"] in MC_QUESTION_TYPES:
         # Component 3: Question entailment (MC questions only)
         if question_entailment and "is_entailed" in question_entailment:
             if question_entailment["is_entailed"]:
@@ -495,8 +553,41 @@ def calculate_quality_score(
     return (passes, breakdown)
 
 
+def _run_llm_validations(
+    question: Dict, client: "OpenAI"
+) -> Tuple[Optional[Dict], Optional[Dict], Optional[List[Dict]], Optional[Dict]]:
+    """Run the LLM validations that apply to a structurally valid question.
+
+    Args:
+        question: Question dict
+        client: OpenAI client
+
+    Returns:
+        Tuple of (question_entailment, answer_entailment, distractor_results,
+        refusal_result); components that don't apply to the question type are None
+    """
+    question_entailment = None
+    answer_entailment = None
+    distractor_results = None
+    refusal_result = None
+
+    if question["question_type"] in MC_QUESTION_TYPES:
+        # MC questions: validate question entailment, answer entailment, and distractors
+        question_entailment = validate_question_entailment(question, client)
+        answer_entailment = validate_answer_entailment(question, client)
+        distractor_results = validate_distractors(question, client)
+    elif question["question_type"] == "refusal":
+        # Refusal questions: skip question entailment, only validate refusal appropriateness
+        refusal_result = validate_refusal(question, client)
+
+    return question_entailment, answer_entailment, distractor_results, refusal_result
+
+
 def validate_and_filter_questions(
-    questions: List[Dict], parsed_sections: Dict, rules: List[Dict], client: Optional[OpenAI] = None
+    questions: List[Dict],
+    parsed_sections: Dict,
+    rules: List[Dict],
+    client: Optional["OpenAI"] = None,
 ) -> Tuple[List[Dict], List[Dict], Dict]:
     """
     Validate all questions and filter by quality thresholds.
@@ -539,98 +630,173 @@ def validate_and_filter_questions(
         "threshold": 90,
     }
 
-    for i, question in enumerate(questions):
-        question_id = question.get("question_id", f"unknown_{i}")
-        print(f"  [{i + 1}/{len(questions)}] Validating {question_id}...")
+    # Structural gate first, then fan the LLM validations of the questions
+    # that pass it out over a thread pool; results are consumed in order
+    with ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY) as executor:
+        structural_checks = []
+        llm_futures = {}
+        for i, question in enumerate(questions):
+            structural_checks.append(validate_structure(question, parsed_sections))
+            if structural_checks[i][0]:
+                llm_futures[i] = executor.submit(_run_llm_validations, question, client)
+
+        for i, question in enumerate(questions):
+            question_id = question.get("question_id", f"unknown_{i}")
+            print(f"  [{i + 1}/{len(questions)}] Validating {question_id}...")
+            structural_valid, structural_issues = structural_checks[i]
+
+            if not structural_valid:
+                # Immediate reject - structural gate
+                question["_validation"] = {
+                    "rejected_reason": "structural_failure",
+                    "structural_valid": False,
+                    "structural_issues": structural_issues,
+                }
+                rejected.append(question)
+                report["rejected"] += 1
+                report["structural_failures"] += 1
+
+                qtype = question.get("question_type", "unknown")
+                report["by_type"].setdefault(qtype, {"validated": 0, "rejected": 0})[
+                    "rejected"
+                ] += 1
+
+                continue
+
+            # Step 2: LLM-based validation (for structurally valid questions)
+            question_entailment, answer_entailment, distractor_results, refusal_result = (
+                llm_futures[i].result()
+            )
 
-        # Step 1: Structural validation (HARD GATE)
-        structural_valid, structural_issues = validate_structure(question, parsed_sections)
+            # Step 3: Calculate quality score (threshold-based)
+            passes_threshold, scoring_breakdown = calculate_quality_score(
+                question,
+                rules,
+                question_entailment,
+                answer_entailment,
+                distractor_results,
+                refusal_result,
+            )
 
-        if not structural_valid:
-            # Immediate reject - structural gate
+            # Add validation metadata to question
             question["_validation"] = {
-                "rejected_reason": "structural_failure",
-                "structural_valid": False,
+                "passes_threshold": passes_threshold,
+                "scoring_breakdown": scoring_breakdown,
+                "structural_valid": structural_valid,
                 "structural_issues": structural_issues,
+                "question_entailment": question_entailment,
+                "answer_entailment": answer_entailment,
+                "distractor_results": distractor_results,
+                "refusal_result": refusal_result,
             }
-            rejected.append(question)
-            report["rejected"] += 1
-            report["structural_failures"] += 1
 
-            qtype = question.get("question_type", "unknown")
-            if qtype not in report["by_type"]:
-                report["by_type"][qtype] = {"validated": 0, "rejected": 0}
-            report["by_type"][qtype]["rejected"] += 1
+            # Step 4: Filter by threshold
+            if passes_threshold:
+                validated.append(question)
+                report["validated"] += 1
+            else:
+                question["_validation"]["rejected_reason"] = "quality_threshold"
+                rejected.append(question)
+                report["rejected"] += 1
+                report["quality_failures"] += 1
+
+            # Track by type
+            type_counts = report["by_type"].setdefault(
+                question["question_type"], {"validated": 0, "rejected": 0}
+            )
+            type_counts["validated" if passes_threshold else "rejected"] += 1
 
-            continue
+    return (validated, rejected, report)
 
-        # Step 2: LLM-based validation (for structurally valid questions)
-
-        # Question entailment (MC questions only - refusal questions skip this)
-        question_entailment = None
-        answer_entailment = None
-        distractor_results = None
-        refusal_result = None
-
-        if question["question_type"] in ["definitional", "scenario_easy", "scenario_hard"]:
-            # MC questions: validate question entailment, answer entailment, and distractors
-            question_entailment = validate_question_entailment(question, client)
-            answer_entailment = validate_answer_entailment(question, client)
-            distractor_results = validate_distractors(question, client)
-        elif question["question_type"] == "refusal":
-            # Refusal questions: skip question entailment, only validate refusal appropriateness
-            refusal_result = validate_refusal(question, client)
-
-        # Step 3: Calculate quality score (threshold-based)
-        passes_threshold, scoring_breakdown = calculate_quality_score(
-            question,
-            rules,
-            question_entailment,
-            answer_entailment,
-            distractor_results,
-            refusal_result,
-        )
 
-        # Add validation metadata to question
-        question["_validation"] = {
-            "passes_threshold": passes_threshold,
-            "scoring_breakdown": scoring_breakdown,
-            "structural_valid": structural_valid,
-            "structural_issues": structural_issues,
-            "question_entailment": question_entailment,
-            "answer_entailment": answer_entailment,
-            "distractor_results": distractor_results,
-            "refusal_result": refusal_result,
-        }
-
-        # Step 4: Filter by threshold
-        if passes_threshold:
-            validated.append(question)
-            report["validated"] += 1
-        else:
-            question["_validation"]["rejected_reason"] = "quality_threshold"
-            rejected.append(question)
-            report["rejected"] += 1
-            report["quality_failures"] += 1
+def _classify_validation_cache_file(fname: str) -> Optional[Tuple[str, str]]:
+    """
+    Map a validation cache filename to its analysis component.
 
-        # Track by type
-        qtype = question["question_type"]
-        if qtype not in report["by_type"]:
-            report["by_type"][qtype] = {"validated": 0, "rejected": 0}
-        if passes_threshold:
-            report["by_type"][qtype]["validated"] += 1
-        else:
-            report["by_type"][qtype]["rejected"] += 1
+    Only files written under the active prompt set count, so the analysis of a
+    --compact-prompts run reads compact results and a full-prompt run reads the rest.
 
-    return (validated, rejected, report)
+    Args:
+        fname: Cache file name (e.g., "5.5_r0_def_distractors.json")
+
+    Returns:
+        Tuple of (component_name, score_key), or None if not a validation cache file
+    """
+    extension = f"{prompt_cache_suffix()}.json"
+    for suffix, component, score_key in VALIDATION_CACHE_COMPONENTS:
+        if fname.endswith(suffix + extension):
+            return component, score_key
+    return None
+
+
+def _load_validation_cache_file(path: str) -> Any:
+    """
+    Read and parse a single validation cache file.
+
+    Args:
+        path: Path to cache file
+
+    Returns:
+        Parsed JSON data, or None if the file is unreadable or malformed
+    """
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (json.JSONDecodeError, ValueError, OSError):
+        return None  # Skip malformed cache files
+
+
+def _summarize_scores(values: List[float]) -> Dict:
+    """
+    Compute summary statistics and decile counts for a list of scores in one pass.
+
+    Args:
+        values: Non-empty list of scores (0-100)
+
+    Returns:
+        Dict with n, mean, stddev (sample), min, max, unique, and decile_counts
+        (aligned with DECILE_LABELS; exact 100s in the last bin)
+    """
+    n = len(values)
+    total = 0
+    total_sq = 0
+    min_val = max_val = values[0]
+    seen = set()
+    decile_counts = [0] * len(DECILE_LABELS)
+
+    for v in values:
+        total += v
+        total_sq += v * v
+        if v < min_val:
+            min_val = v
+        elif v > max_val:
+            max_val = v
+        seen.add(v)
+
+        # Bin index = v // 10; 100 // 10 lands in the last bin
+        if 0 <= v <= 100:
+            decile_counts[int(v // 10)] += 1
+
+    mean = total / n
+    stddev = math.sqrt(max(total_sq - total * mean, 0) / (n - 1)) if n > 1 else 0
+
+    return {
+        "n": n,
+        "mean": mean,
+        "stddev": stddev,
+        "min": min_val,
+        "max": max_val,
+        "unique": len(seen),
+        "decile_counts": decile_counts,
+    }
 
 
 def generate_validation_analysis(
-    questions: List[Dict],
+    questions: Iterable[Dict],
     validated: List[Dict],
     rejected: List[Dict],
     report: Dict,
-    rules: List[Dict],
+    rules: Iterable[Dict],
 ) -> str:
     """
     Generate comprehensive validation analysis report.
@@ -641,18 +807,16 @@ def generate_validation_analysis(
     3. Failure component breakdown
 
     Args:
-        questions: All questions (validated + rejected)
+        questions: All questions (validated + rejected); iterated once, so a
+            streaming reader works as well as a list
         validated: List of validated questions
         rejected: List of rejected questions
         report: Validation report dict
-        rules: All rules from Phase 2
+        rules: All rules from Phase 2; iterated once, like questions
 
     Returns:
         Formatted analysis report as string
     """
-    import statistics
-    from collections import defaultdict
-
     output_lines = []
 
     # ========== SECTION 1: SCORE DISTRIBUTION ANALYSIS ==========
@@ -670,57 +834,43 @@ def generate_validation_analysis(
         "Refusal Appropriateness": [],
     }
 
-    # Collect question confidences by type
+    # Collect question confidences by type (single lookup, unknown types ignored)
+    question_conf_lists = {
+        "definitional": components["Question Conf (definitional)"],
+        "scenario_easy": components["Question Conf (scenario_easy)"],
+        "scenario_hard": components["Question Conf (scenario_hard)"],
+        "refusal": components["Question Conf (refusal)"],
+    }
     for q in questions:
-        conf = q.get("confidence", 0)
-        qtype = q["question_type"]
+        conf_list = question_conf_lists.get(q["question_type"])
+        if conf_list is not None:
+            conf_list.append(q.get("confidence", 0))
 
-        if qtype == "definitional":
-            components["Question Conf (definitional)"].append(conf)
-        elif qtype == "scenario_easy":
-            components["Question Conf (scenario_easy)"].append(conf)
-        elif qtype == "scenario_hard":
-            components["Question Conf (scenario_hard)"].append(conf)
-        elif qtype == "refusal":
-            components["Question Conf (refusal)"].append(conf)
-
-    # Collect rule confidences
-    for rule in rules:
-        components["Rule Confidence"].append(rule.get("confidence", 0))
+    # Collect rule confidences (one value per rule, so build the list in one go)
+    components["Rule Confidence"] = [rule.get("confidence", 0) for rule in rules]
 
     # Collect validation scores from cache
     cache_dir = Path("cache/validation")
     if cache_dir.exists():
-        for cache_file in cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-
-                fname = cache_file.name
-
-                # Question entailment
-                if "question_entailment" in fname:
-                    if isinstance(data, dict) and "confidence" in data:
-                        components["Question Entailment"].append(data["confidence"])
-
-                # Answer entailment
-                elif "answer_entailment" in fname:
-                    if isinstance(data, dict) and "confidence" in data:
-                        components["Answer Entailment"].append(data["confidence"])
-
-                # Distractors
-                elif "distractors" in fname:
+        cache_files = []
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                match = _classify_validation_cache_file(entry.name)
+                if match is not None:
+                    cache_files.append((entry.path, match))
+
+        # Read files concurrently; classification stays on this thread
+        with ThreadPoolExecutor(max_workers=CACHE_LOAD_WORKERS) as executor:
+            loaded = executor.map(_load_validation_cache_file, [path for path, _ in cache_files])
+            for (_, (component, score_key)), data in zip(cache_files, loaded):
+                # Distractor caches hold a list of per-distractor results
+                if component == "Distractor Quality":
                     if isinstance(data, list):
                         for d in data:
-                            if "quality_score" in d:
-                                components["Distractor Quality"].append(d["quality_score"])
-
-                # Refusal
-                elif fname.endswith("_refusal.json"):
-                    if isinstance(data, dict) and "appropriateness_score" in data:
-                        components["Refusal Appropriateness"].append(data["appropriateness_score"])
-            except (json.JSONDecodeError, KeyError, ValueError, OSError):
-                pass  # Skip malformed cache files
+                            if isinstance(d, dict) and score_key in d:
+                                components[component].append(d[score_key])
+                elif isinstance(data, dict) and score_key in data:
+                    components[component].append(data[score_key])
 
     # Print score distribution table
     output_lines.append("\n" + "=" * 80)
@@ -731,19 +881,19 @@ def generate_validation_analysis(
     )
     output_lines.append("-" * 80)
 
+    # Per-component stats, computed once here and reused by the decile section
+    component_stats = {}
+
     for name, values in components.items():
         if not values:
             continue
 
-        n = len(values)
-        mean = statistics.mean(values)
-        stddev = statistics.stdev(values) if n > 1 else 0
-        min_val = min(values)
-        max_val = max(values)
-        unique = len(set(values))
+        stats = _summarize_scores(values)
+        component_stats[name] = stats
 
         output_lines.append(
-            f"{name:<35} {n:>4}  {mean:>5.1f} {stddev:>6.2f}  {min_val:>3}  {max_val:>3}  {unique:>8}"
+            f"{name:<35} {stats['n']:>4}  {stats['mean']:>5.1f} {stats['stddev']:>6.2f}  "
+            f"{stats['min']:>3}  {stats['max']:>3}  {stats['unique']:>8}"
         )
 
     output_lines.append("=" * 80)
@@ -756,53 +906,15 @@ def generate_validation_analysis(
         if not values:
             continue
 
+        stats = component_stats[name]
         output_lines.append(f"\n{name}:")
         output_lines.append(
-            f"  n={len(values)}, mean={statistics.mean(values):.1f}, stddev={statistics.stdev(values) if len(values) > 1 else 0:.2f}"
+            f"  n={stats['n']}, mean={stats['mean']:.1f}, stddev={stats['stddev']:.2f}"
         )
 
-        # Count frequency by decile
-        deciles = {
-            "  0-9": 0,
-            " 10-19": 0,
-            " 20-29": 0,
-            " 30-39": 0,
-            " 40-49": 0,
-            " 50-59": 0,
-            " 60-69": 0,
-            " 70-79": 0,
-            " 80-89": 0,
-            " 90-99": 0,
-            "  100": 0,
-        }
-
-        for v in values:
-            if v == 100:
-                deciles["  100"] += 1
-            elif 0 <= v < 10:
-                deciles["  0-9"] += 1
-            elif 10 <= v < 20:
-                deciles[" 10-19"] += 1
-            elif 20 <= v < 30:
-                deciles[" 20-29"] += 1
-            elif 30 <= v < 40:
-                deciles[" 30-39"] += 1
-            elif 40 <= v < 50:
-                deciles[" 40-49"] += 1
-            elif 50 <= v < 60:
-                deciles[" 50-59"] += 1
-            elif 60 <= v < 70:
-                deciles[" 60-69"] += 1
-            elif 70 <= v < 80:
-                deciles[" 70-79"] += 1
-            elif 80 <= v < 90:
-                deciles[" 80-89"] += 1
-            elif 90 <= v < 100:
-                deciles[" 90-99"] += 1
-
         # Print histogram
         output_lines.append("  Decile distribution:")
-        for decile, count in deciles.items():
+        for decile, count in zip(DECILE_LABELS, stats["decile_counts"]):
             if count > 0:
                 pct = count / len(values) * 100
                 bar = "█" * min(60, int(pct * 0.6))  # Scale bars for readability
@@ -852,8 +964,8 @@ def generate_validation_analysis(
     for qtype in ["definitional", "scenario_easy", "scenario_hard", "refusal"]:
         if failures_by_type[qtype]:
             output_lines.append(f"\n  {qtype}:")
+            total_rejected = report["by_type"][qtype]["rejected"]
             for component, count in sorted(failures_by_type[qtype].items(), key=lambda x: -x[1]):
-                total_rejected = report["by_type"][qtype]["rejected"]
                 pct = count / total_rejected * 100 if total_rejected > 0 else 0
                 output_lines.append(
                     f"    - {component:30} {count:2}/{total_rejected:2} ({pct:5.1f}%)"
@@ -31,6 +31,16 @@ class TestArgumentParsing:
             parser.parse_args(["--help"])
         assert exc_info.value.code == 0
 
+    def test_parser_is_built_once(self):
+        """Test that the parser is reused across calls without leaking state."""
+        assert create_parser() is create_parser()
+
+        first = parse_args(["eval", "--model", "gpt-4o-mini"])
+        second = parse_args(["eval"])
+
+        assert first.model == "gpt-4o-mini"
+        assert second.model == "gpt-4o"
+
     def test_parse_all_command_basic(self):
         """Test parsing 'all' command with defaults."""
         args = parse_args(["all"])
@@ -153,6 +163,41 @@ class TestArgumentParsing:
 
         assert args.question_id == "*_refusal"
 
+    def test_parse_rules_command_with_batch_size(self):
+        """Test parsing 'rules' command with multi-section batching."""
+        assert parse_args(["rules"]).batch_size == 1
+        assert parse_args(["rules", "--batch-size", "8"]).batch_size == 8
+
+    @pytest.mark.parametrize("value", ["0", "-2"])
+    def test_parse_rules_command_rejects_non_positive_batch_size(self, value, capsys):
+        """Test that a batch size below 1 is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["rules", "--batch-size", value])
+
+        assert exc_info.value.code == 2
+        assert "--batch-size" in capsys.readouterr().err
+
+    def test_parse_eval_command_with_batch(self):
+        """Test parsing 'eval' command with Batch API submission."""
+        assert parse_args(["eval"]).batch is False
+        assert parse_args(["eval", "--batch"]).batch is True
+
+    def test_parse_eval_command_with_max_concurrency(self):
+        """Test parsing 'eval' command with a concurrency limit."""
+        from src.config import LLM_MAX_CONCURRENCY
+
+        assert parse_args(["eval"]).max_concurrency == LLM_MAX_CONCURRENCY
+        assert parse_args(["eval", "--max-concurrency", "20"]).max_concurrency == 20
+
+    @pytest.mark.parametrize("value", ["0", "-1", "two"])
+    def test_parse_eval_command_rejects_non_positive_max_concurrency(self, value, capsys):
+        """Test that a max concurrency below 1 is a usage error, not a crash later."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["eval", "--max-concurrency", value])
+
+        assert exc_info.value.code == 2
+        assert "--max-concurrency" in capsys.readouterr().err
+
     def test_parse_eval_command_with_all_options(self):
         """Test parsing 'eval' command with all options."""
         args = parse_args(
@@ -209,6 +254,11 @@ class TestArgumentParsing:
         assert args.dry_run is True
         assert args.ignore_cache is True
 
+    def test_global_compact_prompts_flag(self):
+        """Test global --compact-prompts flag."""
+        assert parse_args(["--compact-prompts", "rules"]).compact_prompts is True
+        assert parse_args(["rules"]).compact_prompts is False
+
 
 class TestFilteringSections:
     """Test section filtering utility."""
@@ -255,6 +305,14 @@ class TestFilteringSections:
         assert len(result) == 0
         assert result == {}
 
+    def test_filter_sections_matches_whole_components(self, sample_sections):
+        """Test a prefix does not match a longer section number."""
+        sample_sections["5.55"] = {"title": "Section 5.55", "text": "Unrelated"}
+
+        result = filter_sections(sample_sections, "5.5")
+
+        assert list(result) == ["5.5", "5.5.1", "5.5.2"]
+
 
 class TestFilteringRules:
     """Test rule filtering utility."""
@@ -313,6 +371,25 @@ class TestFilteringRules:
         assert len(result) == 0
         assert result == []
 
+    def test_filter_rules_literal_pattern_is_exact(self, sample_rules):
+        """Test a pattern without glob characters matches only that exact ID."""
+        sample_rules.append({"rule_id": "5.5_r01", "rule_text": "Longer ID"})
+
+        result = filter_rules(sample_rules, "5.5_r0")
+
+        assert [rule["rule_id"] for rule in result] == ["5.5_r0"]
+
+    def test_filter_rules_reuses_compiled_pattern(self, sample_rules):
+        """Test the same glob is translated and compiled only once."""
+        cli_utils._compile_glob.cache_clear()
+
+        filter_rules(sample_rules, "5.5_*")
+        filter_rules(sample_rules, "5.5_*")
+
+        info = cli_utils._compile_glob.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 class TestFilteringQuestions:
     """Test question filtering utility."""
@@ -409,7 +486,7 @@ class TestCacheManagement:
         """Test cleaning cache for 'rules' command with section filter."""
         clean_cache_by_command("rules", section="5.5")
 
-        mock_clean.assert_called_once_with("cache/rules", pattern="5.5*")
+        mock_clean.assert_called_once_with("cache/rules", pattern=("5.5", "5.5_*", "5.5.*"))
 
     @patch("src.cli.utils.clean_cache_dir")
     def test_clean_cache_by_command_questions(self, mock_clean):
@@ -439,6 +516,13 @@ class TestCacheManagement:
 
         mock_clean.assert_called_once_with("cache/validation", pattern="*_refusal*")
 
+    @patch("src.cli.utils.clean_cache_dir")
+    def test_clean_cache_by_command_eval_with_question_id(self, mock_clean):
+        """Test cleaning cache for 'eval' command with question filter."""
+        clean_cache_by_command("eval", question_id="5.5_r0_def")
+
+        mock_clean.assert_called_once_with("cache/evaluation", pattern="5.5_r0_def*")
+
     @patch("src.cli.utils.clean_cache_dir")
     def test_clean_cache_by_command_all(self, mock_clean):
         """Test cleaning cache for 'all' command cleans all caches."""
@@ -447,6 +531,53 @@ class TestCacheManagement:
         # Should call clean_cache_dir 4 times (once for each cache directory)
         assert mock_clean.call_count == 4
 
+    @patch("src.cli.utils.clean_cache_dir")
+    def test_clean_cache_by_command_all_with_section(self, mock_clean):
+        """Test 'all' with a section only cleans that section's cache files."""
+        clean_cache_by_command("all", section="5.5")
+
+        section_patterns = ("5.5", "5.5_*", "5.5.*")
+        mock_clean.assert_any_call("cache/rules", pattern=section_patterns)
+        mock_clean.assert_any_call("cache/questions", pattern=section_patterns)
+        mock_clean.assert_any_call("cache/validation", pattern=section_patterns)
+
+    def test_clean_cache_by_command_all_with_section_keeps_sibling_sections(
+        self, tmp_path, monkeypatch
+    ):
+        """Test 'all --section 5.1' leaves the caches of sections 5.10-5.19 alone."""
+        monkeypatch.chdir(tmp_path)
+        files = {
+            "rules": ["5.1.json", "5.1.2.json", "5.1_compact.json", "5.12.json"],
+            "questions": ["5.1_r0.json", "5.1.2_r3.json", "5.12_r3.json"],
+            "validation": ["5.1_r0_def_distractors.json", "5.19_r0_refusal_distractors.json"],
+        }
+        for cache_name, names in files.items():
+            cache_dir = tmp_path / "cache" / cache_name
+            cache_dir.mkdir(parents=True)
+            for name in names:
+                (cache_dir / name).write_text("{}")
+
+        clean_cache_by_command("all", section="5.1")
+
+        remaining = {
+            cache_name: sorted(p.name for p in (tmp_path / "cache" / cache_name).iterdir())
+            for cache_name in files
+        }
+        assert remaining == {
+            "rules": ["5.12.json"],
+            "questions": ["5.12_r3.json"],
+            "validation": ["5.19_r0_refusal_distractors.json"],
+        }
+
+    def test_clean_cache_dir_with_pattern(self, tmp_path):
+        """Test only JSON files whose stem matches the pattern are deleted."""
+        for name in ["5.5_r0.json", "5.5_r1.json", "5.6_r0.json", "5.5_notes.txt"]:
+            (tmp_path / name).write_text("{}")
+
+        cli_utils.clean_cache_dir(str(tmp_path), pattern="5.5_*")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["5.5_notes.txt", "5.6_r0.json"]
+
 
 class TestUtilityHelpers:
     """Test utility helper functions."""
@@ -485,6 +616,19 @@ class TestUtilityHelpers:
         # Cleanup
         cli_utils.DRY_RUN_MODE = False
 
+    def test_log_llm_call_follows_runtime_flag(self, capsys):
+        """Test log_llm_call sees verbose mode enabled after import."""
+        from src.pipeline.util import log_llm_call
+
+        log_llm_call("gpt-test", "Quiet prompt")
+        cli_utils.VERBOSE_MODE = True
+        log_llm_call("gpt-test", "Loud prompt")
+        cli_utils.VERBOSE_MODE = False
+
+        captured = capsys.readouterr()
+        assert "Quiet prompt" not in captured.err
+        assert "Loud prompt" in captured.err
+
     def test_load_json_file_success(self, tmp_path):
         """Test loading valid JSON file."""
         import json
@@ -515,6 +659,83 @@ class TestUtilityHelpers:
         loaded_data = json.loads(test_file.read_text())
         assert loaded_data == test_data
 
+    def test_ensure_dir_creates_once(self, tmp_path):
+        """Test that ensure_dir creates nested dirs and skips mkdir on repeat calls."""
+        target = tmp_path / "a" / "b"
+
+        cli_utils.ensure_dir(target)
+        assert target.is_dir()
+
+        with patch("src.cli.utils.Path.mkdir") as mock_mkdir:
+            cli_utils.ensure_dir(target)
+        mock_mkdir.assert_not_called()
+
+    def test_save_json_file_matches_stdlib_layout(self, tmp_path):
+        """Test that saved JSON keeps the indent=2, non-ASCII-preserving layout."""
+        import json
+
+        test_file = tmp_path / "output.json"
+        test_data = {"section": "5.5", "text": "Article 51 – “civilians”", "rules": [], "n": 1.5}
+
+        cli_utils.save_json_file(test_data, str(test_file))
+
+        expected = json.dumps(test_data, indent=2, ensure_ascii=False)
+        assert test_file.read_text(encoding="utf-8") == expected
+
+    def test_save_and_load_gzip_json_file(self, tmp_path):
+        """Test that a .gz path round-trips through compressed JSON."""
+        import gzip
+        import json
+
+        test_file = tmp_path / "questions.json.gz"
+        test_data = [{"question_id": "5.5_r0_def", "question": "Who may be targeted?"}]
+
+        cli_utils.save_json_file(test_data, str(test_file))
+
+        assert json.loads(gzip.decompress(test_file.read_bytes())) == test_data
+        assert cli_utils.load_json_file(str(test_file)) == test_data
+
+    def test_load_json_file_malformed(self, tmp_path):
+        """Test that malformed JSON raises json.JSONDecodeError."""
+        import json
+
+        test_file = tmp_path / "bad.json"
+        test_file.write_text("{not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            cli_utils.load_json_file(str(test_file))
+
+    def test_load_section_text_falls_back_to_next_file(self, tmp_path, monkeypatch):
+        """Test a missing sections file is skipped in favor of the next one."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data" / "extracted").mkdir(parents=True)
+        (tmp_path / "data" / "extracted" / "section_5_5.json").write_text(
+            '{"5.5.3": {"text": "Section text"}}'
+        )
+
+        cli_utils.invalidate_section_cache()
+
+        assert cli_utils.load_section_text("5.5.3") == "Section text"
+        assert cli_utils.load_section_text("9.9") == ""
+        cli_utils.invalidate_section_cache()
+
+    def test_load_section_text_parses_file_once(self, tmp_path, monkeypatch):
+        """Test repeated lookups reuse the parsed sections file."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data" / "extracted").mkdir(parents=True)
+        (tmp_path / "data" / "extracted" / "sections.json").write_text(
+            '{"5.5.1": {"text": "One"}, "5.5.2": {"text": "Two"}}'
+        )
+        cli_utils.invalidate_section_cache()
+
+        assert cli_utils.load_section_text("5.5.1") == "One"
+        assert cli_utils.load_section_text("5.5.2") == "Two"
+
+        info = cli_utils._load_sections_file.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        cli_utils.invalidate_section_cache()
+
     def test_parse_llm_json_response_valid(self):
         """Test parsing valid JSON from LLM response."""
         from src.pipeline.util import parse_llm_json_response
@@ -528,6 +749,56 @@ class TestUtilityHelpers:
 
         assert result == {"result": "success", "value": 42}
 
+    def test_render_prompt_matches_str_format(self):
+        """Test render_prompt fills every config prompt exactly like str.format."""
+        import string
+
+        import src.config as config
+        from src.pipeline.util import render_prompt
+
+        for name in dir(config):
+            template = getattr(config, name)
+            if not (name.endswith(("_PROMPT", "_PROMPT_COMPACT")) and isinstance(template, str)):
+                continue
+            fields = {
+                field: f"<{field} {{literal}}>"
+                for _, field, _, _ in string.Formatter().parse(template)
+                if field
+            }
+
+            assert render_prompt(template, **fields) == template.format(**fields), name
+
+    def test_compact_prompts_keep_placeholders(self):
+        """Test each compact prompt takes exactly the fields of the prompt it replaces."""
+        import string
+
+        from src.config import COMPACT_PROMPTS
+
+        def fields(template):
+            return {field for _, field, _, _ in string.Formatter().parse(template) if field}
+
+        for full, compact in COMPACT_PROMPTS.items():
+            assert fields(compact) == fields(full)
+            assert len(compact) < len(full)
+
+    def test_render_prompt_compact_mode(self, monkeypatch):
+        """Test --compact-prompts swaps in the compact variant and leaves other prompts alone."""
+        from src.config import EVAL_MC_PROMPT, RULE_EXTRACTION_PROMPT
+        from src.pipeline.util import render_prompt
+
+        fields = {"section_id": "5.5", "section_title": "Title", "section_text": "Text"}
+        full = render_prompt(RULE_EXTRACTION_PROMPT, **fields)
+
+        monkeypatch.setattr(cli_utils, "COMPACT_PROMPT_MODE", True)
+        compact = render_prompt(RULE_EXTRACTION_PROMPT, **fields)
+        assert len(compact) < len(full)
+        assert "Section Title: Title" in compact
+
+        eval_fields = {f"option_{c}": c for c in "abcd"}
+        assert render_prompt(EVAL_MC_PROMPT, question_text="Q", **eval_fields) == (
+            EVAL_MC_PROMPT.format(question_text="Q", **eval_fields)
+        )
+
     def test_parse_llm_json_response_invalid(self):
         """Test parsing invalid JSON from LLM response raises error."""
         import json
@@ -541,3 +812,162 @@ class TestUtilityHelpers:
 
         with pytest.raises(json.JSONDecodeError):
             parse_llm_json_response(mock_response)
+
+
+class TestRateLimiter:
+    """Test the shared LLM request/token rate limiter."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fake monotonic clock advanced by time.sleep."""
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        with (
+            patch("src.pipeline.util.time.monotonic", side_effect=lambda: now[0]),
+            patch("src.pipeline.util.time.sleep", side_effect=sleep),
+        ):
+            yield sleeps
+
+    def test_unlimited_never_waits(self, clock):
+        """Test a limiter without limits lets every request through."""
+        from src.pipeline.util import RateLimiter
+
+        limiter = RateLimiter()
+        for _ in range(100):
+            limiter.acquire(10_000)
+
+        assert clock == []
+
+    def test_requests_per_minute_paces_after_burst(self, clock):
+        """Test a full bucket bursts, then requests are spaced at 60/rpm seconds."""
+        from src.pipeline.util import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=60)
+        for _ in range(61):
+            limiter.acquire()
+
+        assert clock == [pytest.approx(1.0)]
+
+    def test_tokens_per_minute_reconciles_usage(self, clock):
+        """Test reported usage above the estimate delays the next request."""
+        from src.pipeline.util import RateLimiter
+
+        limiter = RateLimiter(tokens_per_minute=6_000)
+        limiter.acquire(1_000)
+        limiter.record_usage(1_000, 6_000)
+        limiter.acquire(600)
+
+        assert clock == [pytest.approx(6.0)]
+
+    def test_create_chat_completion_passes_request_through(self):
+        """Test the throttled helper forwards the request unchanged."""
+        from src.pipeline.util import create_chat_completion
+
+        client = Mock()
+        messages = [{"role": "user", "content": "Hello"}]
+
+        response = create_chat_completion(client, model="gpt-4.1", messages=messages)
+
+        client.chat.completions.create.assert_called_once_with(model="gpt-4.1", messages=messages)
+        assert response is client.chat.completions.create.return_value
+
+
+class TestCommands:
+    """Test command handlers with pipeline stages mocked out."""
+
+    def test_cmd_rules_keeps_section_order(self, tmp_path):
+        """Test concurrent rule extraction still saves rules in section order."""
+        import json
+        import time
+        from types import SimpleNamespace
+
+        from src.cli.commands import cmd_rules
+
+        sections = {"5.5": {"title": "A"}, "5.5.1": {"title": "B"}, "5.5.2": {"title": "C"}}
+        input_file = tmp_path / "sections.json"
+        input_file.write_text(json.dumps(sections))
+        output_file = tmp_path / "rules.json"
+
+        def fake_extract_rules(section_id, section_data, client):
+            # Earlier sections finish last
+            time.sleep(0.01 * (3 - len(section_id.split("."))))
+            return [{"rule_id": f"{section_id}_r0"}]
+
+        args = SimpleNamespace(input=str(input_file), section=None, output=str(output_file))
+        with (
+            patch("src.lib.openai_client.get_openai_client"),
+            patch("src.pipeline.extract.extract_rules", side_effect=fake_extract_rules),
+        ):
+            cmd_rules(args)
+
+        rules = json.loads(output_file.read_text())
+        assert [r["rule_id"] for r in rules] == ["5.5_r0", "5.5.1_r0", "5.5.2_r0"]
+
+    def test_cmd_rules_uses_in_memory_sections(self, tmp_path):
+        """Test that sections and client handed over by a previous stage are reused."""
+        from types import SimpleNamespace
+
+        from src.cli.commands import cmd_rules
+
+        output_file = tmp_path / "rules.json"
+        args = SimpleNamespace(
+            input=str(tmp_path / "missing.json"),
+            section=None,
+            output=str(output_file),
+            sections={"5.5": {"title": "A"}},
+            client=Mock(),
+        )
+        with (
+            patch("src.lib.openai_client.get_openai_client") as mock_get_client,
+            patch(
+                "src.pipeline.extract.extract_rules", return_value=[{"rule_id": "5.5_r0"}]
+            ) as mock_extract,
+        ):
+            rules = cmd_rules(args)
+
+        assert rules == [{"rule_id": "5.5_r0"}]
+        assert output_file.exists()
+        # The client handed over by the caller is reused
+        mock_get_client.assert_not_called()
+        assert mock_extract.call_args[0][2] is args.client
+
+    def test_cmd_score_streams_input(self, tmp_path):
+        """Test that score reads responses from disk and writes results and report."""
+        import json
+        from types import SimpleNamespace
+
+        from src.cli.commands import cmd_score
+
+        responses = [
+            {
+                "question_id": "5.5_r0_def",
+                "question_type": "definitional",
+                "correct_answer": "B",
+                "model_response": {"selected_answer": "B", "reasoning": "r", "confidence": 0.9},
+            },
+            {
+                "question_id": "5.5_r0_refusal",
+                "question_type": "refusal",
+                "model_response": {"refusal": True, "refusal_reason": "unsafe"},
+            },
+        ]
+        input_file = tmp_path / "eval_responses.json"
+        input_file.write_text(json.dumps(responses))
+
+        args = SimpleNamespace(
+            input=str(input_file),
+            output=str(tmp_path / "eval_scored.json"),
+            report=str(tmp_path / "report" / "scoring_analysis.txt"),
+        )
+        cmd_score(args)
+
+        scored = json.loads((tmp_path / "eval_scored.json").read_text())
+        assert scored["metadata"]["total_questions"] == 2
+        assert scored["summary"]["overall"]["correct"] == 2
+        assert isinstance(scored["scored_results"][0]["metadata"], dict)
+        assert (tmp_path / "report" / "scoring_analysis.txt").exists()
@@ -6,7 +6,9 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.pipeline.evaluate import (
+    _eval_cache_key,
     evaluate_mc_question,
+    evaluate_questions_batch,
     evaluate_refusal_question,
     run_evaluation,
     shuffle_options,
@@ -105,6 +107,20 @@ class TestEvaluateMCQuestion:
         # With SHUFFLE_SEED, shuffled should differ from original
         assert result["shuffled_options"] != result["original_options"]
 
+    def test_evaluate_mc_question_shuffle_independent_of_call_order(
+        self, sample_mc_question, mock_openai_client
+    ):
+        """Test that a question's shuffle does not depend on earlier evaluations."""
+        other_question = dict(sample_mc_question, question_id="5.5_r1_def")
+
+        with patch("src.cli.utils.DRY_RUN_MODE", False):
+            first = evaluate_mc_question(sample_mc_question, "gpt-4o", mock_openai_client)
+            evaluate_mc_question(other_question, "gpt-4o", mock_openai_client)
+            again = evaluate_mc_question(sample_mc_question, "gpt-4o", mock_openai_client)
+
+        assert first["shuffled_options"] == again["shuffled_options"]
+        assert first["correct_answer"] == again["correct_answer"]
+
     def test_evaluate_mc_question_calls_openai(self, sample_mc_question, mock_openai_client):
         """Test that OpenAI API is called."""
         with patch("src.cli.utils.DRY_RUN_MODE", False):
@@ -291,3 +307,200 @@ class TestRunEvaluation:
         # With filter, only 1 question should be evaluated
         assert summary["total_evaluated"] == 1
         assert summary["refusal_questions"] == 1
+
+    def test_run_evaluation_preserves_question_order(
+        self, sample_questions, mock_openai_client, tmp_path
+    ):
+        """Test that concurrent evaluation keeps results in input order."""
+        questions = sample_questions * 3
+        for i, q in enumerate(questions):
+            questions[i] = dict(q, question_id=f"{q['question_id']}_{i}")
+
+        questions_file = tmp_path / "questions.json"
+        with open(questions_file, "w") as f:
+            json.dump(questions, f)
+
+        output_file = tmp_path / "output" / "eval_responses.json"
+
+        with patch("src.cli.utils.should_use_cache", return_value=False):
+            run_evaluation(
+                str(questions_file), str(output_file), model="gpt-4o", client=mock_openai_client
+            )
+
+        with open(output_file) as f:
+            results = json.load(f)
+
+        assert [r["question_id"] for r in results] == [q["question_id"] for q in questions]
+
+    def test_evaluate_questions_batch_reassembles_by_custom_id(self, sample_questions):
+        """Test that batch output lines are matched back to their questions."""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(
+            id="batch-1", status="completed", output_file_id="file-out", error_file_id=None
+        )
+
+        def_key, refusal_key = (_eval_cache_key(q, "gpt-4o") for q in sample_questions)
+
+        # Output lines arrive out of order; the refusal request failed
+        output_lines = [
+            {
+                "custom_id": refusal_key,
+                "response": {"status_code": 500, "body": {}},
+            },
+            {
+                "custom_id": def_key,
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [{"message": {"content": json.dumps({"selected_answer": "B"})}}]
+                    },
+                },
+            },
+        ]
+        client.files.content.return_value = Mock(
+            text="\n".join(json.dumps(line) for line in output_lines)
+        )
+
+        results = evaluate_questions_batch(sample_questions, "gpt-4o", client, poll_interval=0)
+
+        assert list(results) == [def_key]
+        assert results[def_key]["question_id"] == "5.5_r0_def"
+        assert results[def_key]["model_response"] == {"selected_answer": "B"}
+        assert results[def_key]["shuffled_options"]
+
+        # One JSONL request per question was uploaded, identified by its cache key
+        uploaded = client.files.create.call_args[1]["file"][1].decode("utf-8").splitlines()
+        assert [json.loads(line)["custom_id"] for line in uploaded] == [def_key, refusal_key]
+
+    def test_evaluate_questions_batch_keeps_partial_results(self, sample_questions, capsys):
+        """Test an expired batch keeps finished requests and reports failed ones."""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(
+            id="batch-1", status="expired", output_file_id="file-out", error_file_id="file-err"
+        )
+
+        def_key, refusal_key = (_eval_cache_key(q, "gpt-4o") for q in sample_questions)
+        output_line = {
+            "custom_id": def_key,
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "choices": [{"message": {"content": json.dumps({"selected_answer": "B"})}}]
+                },
+            },
+        }
+        error_line = {
+            "custom_id": refusal_key,
+            "response": None,
+            "error": {"code": "batch_expired", "message": "Request expired"},
+        }
+        client.files.content.side_effect = lambda file_id: Mock(
+            text=json.dumps(output_line if file_id == "file-out" else error_line)
+        )
+
+        # The definitional question appears twice; the identical request is submitted once
+        questions = sample_questions + [sample_questions[0]]
+        results = evaluate_questions_batch(questions, "gpt-4o", client, poll_interval=0)
+
+        assert list(results) == [def_key]
+        uploaded = client.files.create.call_args[1]["file"][1].decode("utf-8").splitlines()
+        assert [json.loads(line)["custom_id"] for line in uploaded] == [def_key, refusal_key]
+
+        output = capsys.readouterr().out
+        assert f"Skipping duplicate request in batch: {def_key}" in output
+        assert "ERROR evaluating 5.5_r0_refusal" in output
+        assert "batch_expired" in output
+
+    def test_run_evaluation_batch_evaluates_same_id_questions_separately(
+        self, sample_questions, tmp_path, monkeypatch
+    ):
+        """Test that same-ID questions with different text each get their own batch result."""
+        monkeypatch.chdir(tmp_path)
+        first = sample_questions[0]
+        second = dict(first, question="Whom may combatants lawfully attack?")
+        questions_file = tmp_path / "questions.json"
+        with open(questions_file, "w") as f:
+            json.dump([first, second], f)
+
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(
+            id="batch-1", status="completed", output_file_id="file-out", error_file_id=None
+        )
+
+        def batch_output(file_id):
+            # Answer each uploaded request with a response naming its own question text
+            uploaded = client.files.create.call_args[1]["file"][1].decode("utf-8")
+            lines = []
+            for request in map(json.loads, uploaded.splitlines()):
+                prompt = request["body"]["messages"][1]["content"]
+                answer = "B" if second["question"] in prompt else "A"
+                content = json.dumps({"selected_answer": answer})
+                body = {"choices": [{"message": {"content": content}}]}
+                lines.append(
+                    json.dumps(
+                        {
+                            "custom_id": request["custom_id"],
+                            "response": {"status_code": 200, "body": body},
+                        }
+                    )
+                )
+            return Mock(text="\n".join(lines))
+
+        client.files.content.side_effect = batch_output
+
+        output_file = tmp_path / "eval_responses.json"
+        with patch("src.cli.utils.should_use_cache", return_value=True):
+            run_evaluation(
+                str(questions_file), str(output_file), model="gpt-4o", client=client, batch=True
+            )
+
+        with open(output_file) as f:
+            results = json.load(f)
+
+        uploaded = client.files.create.call_args[1]["file"][1].decode("utf-8").splitlines()
+        assert len(uploaded) == 2
+        assert [r["question_text"] for r in results] == [first["question"], second["question"]]
+        assert [r["model_response"]["selected_answer"] for r in results] == ["A", "B"]
+
+        # Each question's result is cached under its own key
+        for question, result in zip([first, second], results):
+            cache_file = (
+                tmp_path / "cache" / "evaluation" / f"{_eval_cache_key(question, 'gpt-4o')}.json"
+            )
+            with open(cache_file) as f:
+                assert json.load(f) == result
+
+    def test_evaluate_questions_batch_without_output_raises(self, sample_questions):
+        """Test a batch that produced no output or error file is an error."""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(
+            id="batch-1", status="failed", output_file_id=None, error_file_id=None
+        )
+
+        with pytest.raises(RuntimeError, match="failed"):
+            evaluate_questions_batch(sample_questions, "gpt-4o", client, poll_interval=0)
+
+    def test_run_evaluation_cache_is_keyed_by_model(
+        self, sample_questions, mock_openai_client, tmp_path, monkeypatch
+    ):
+        """Test that switching models does not replay cached responses."""
+        monkeypatch.chdir(tmp_path)
+        questions_file = tmp_path / "questions.json"
+        with open(questions_file, "w") as f:
+            json.dump(sample_questions[:1], f)
+
+        output_file = tmp_path / "eval_responses.json"
+
+        with patch("src.cli.utils.should_use_cache", return_value=True):
+            for model in ["gpt-4o", "gpt-4o", "gpt-4o-mini"]:
+                run_evaluation(
+                    str(questions_file), str(output_file), model=model, client=mock_openai_client
+                )
+
+        # Second gpt-4o run is served from cache; gpt-4o-mini is a fresh call
+        assert mock_openai_client.chat.completions.create.call_count == 2
+        assert len(list((tmp_path / "cache" / "evaluation").glob("5.5_r0_def_*.json"))) == 2
@@ -6,7 +6,12 @@ from pathlib import Path
 
 import pytest
 
-from src.pipeline.export import export_to_csv, map_question_to_csv_row
+from src.pipeline.export import (
+    CSV_FIELDNAMES,
+    export_to_csv,
+    map_question_to_csv_row,
+    map_question_to_csv_tuple,
+)
 
 
 @pytest.fixture
@@ -124,6 +129,16 @@ def test_map_question_to_csv_row_refusal(sample_refusal_question):
     assert "5.5_r1" in row["Notes"]
 
 
+def test_map_question_to_csv_tuple_matches_row(sample_mc_question, sample_refusal_question):
+    """Test that tuple values line up with the CSV columns of the row dict."""
+    for question in (sample_mc_question, sample_refusal_question):
+        values = map_question_to_csv_tuple(question)
+        row = map_question_to_csv_row(question)
+
+        assert len(values) == len(CSV_FIELDNAMES)
+        assert values == tuple(row[name] for name in CSV_FIELDNAMES)
+
+
 def test_export_to_csv(sample_mc_question, sample_refusal_question):
     """Test CSV file generation."""
     questions = [sample_mc_question, sample_refusal_question]
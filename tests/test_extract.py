@@ -6,12 +6,19 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from src.config import RULES_RESPONSE_FORMAT
 from src.pipeline.extract import estimate_cost, extract_rules, validate_verbatim_rules
 
 
 class TestExtractRules:
     """Test the extract_rules function."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.extract.save_json_file"):
+            yield
+
     @pytest.fixture
     def mock_openai_client(self):
         """Create a mock OpenAI client with realistic response."""
@@ -89,7 +96,20 @@ class TestExtractRules:
             call_kwargs = mock_openai_client.chat.completions.create.call_args[1]
             assert call_kwargs["model"] == "gpt-4.1"
             assert call_kwargs["temperature"] == 0.1
-            assert call_kwargs["response_format"] == {"type": "json_object"}
+            assert call_kwargs["response_format"] == RULES_RESPONSE_FORMAT
+
+    def test_rules_response_format_is_strict_and_matches_response(self, mock_openai_client):
+        """Test the rules schema obeys strict-mode rules and accepts a well-formed response."""
+        import jsonschema
+
+        json_schema = RULES_RESPONSE_FORMAT["json_schema"]
+        rule_schema = json_schema["schema"]["properties"]["rules"]["items"]
+        assert json_schema["strict"] is True
+        assert set(rule_schema["required"]) == set(rule_schema["properties"])
+        assert rule_schema["additionalProperties"] is False
+
+        content = mock_openai_client.chat.completions.create().choices[0].message.content
+        jsonschema.validate(json.loads(content), json_schema["schema"])
 
     def test_extract_rules_adds_source_metadata(self, mock_openai_client, sample_section_data):
         """Test that source metadata is added to each rule."""
@@ -199,35 +219,161 @@ class TestExtractRules:
         with patch("src.pipeline.extract.Path") as mock_path:
             # First call: cache doesn't exist
             mock_path.return_value.exists.return_value = False
-            mock_path.return_value.parent.mkdir = Mock()
 
-            # Mock the file write
-            written_data = None
+            with patch("src.pipeline.extract.save_json_file") as mock_save:
+                _ = extract_rules("5.5", sample_section_data, mock_openai_client)
+
+                # Verify data was written to the section's cache file
+                mock_save.assert_called_once()
+                cached_data, cache_path = mock_save.call_args.args
+                assert cache_path is mock_path.return_value
+                assert len(cached_data) == 2
+
+    def test_extract_rules_caches_compact_prompts_separately(
+        self, mock_openai_client, sample_section_data, monkeypatch
+    ):
+        """Test that --compact-prompts results use their own cache file."""
+        import src.cli.utils as cli_utils
 
-            def mock_open_write(file_path, mode="r", **kwargs):
-                nonlocal written_data
-                if "w" in mode:
-                    import io
+        monkeypatch.setattr(cli_utils, "COMPACT_PROMPT_MODE", True)
+        with patch("src.pipeline.extract.Path") as mock_path:
+            mock_path.return_value.exists.return_value = False
 
-                    buffer = io.StringIO()
-                    original_close = buffer.close
+            extract_rules("5.5", sample_section_data, mock_openai_client)
 
-                    def custom_close():
-                        nonlocal written_data
-                        written_data = buffer.getvalue()
-                        original_close()
+        mock_path.assert_called_once_with("cache/rules/5.5_compact.json")
 
-                    buffer.close = custom_close
-                    return buffer
-                return open(file_path, mode, **kwargs)
 
-            with patch("builtins.open", side_effect=mock_open_write):
-                _ = extract_rules("5.5", sample_section_data, mock_openai_client)
+class TestExtractRulesBatch:
+    """Test batched rule extraction across several sections."""
 
-                # Verify data was written
-                assert written_data is not None
-                cached_data = json.loads(written_data)
-                assert len(cached_data) == 2
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.extract.save_json_file"):
+            yield
+
+    @pytest.fixture
+    def sections(self):
+        """Two sibling sections."""
+        return {
+            "5.5.1": {
+                "title": "Combatants",
+                "text": "Combatants may make enemy combatants the object of attack.",
+                "page_numbers": [1],
+            },
+            "5.5.2": {
+                "title": "Civilians",
+                "text": "Civilians may not be made the object of attack.",
+                "page_numbers": [2],
+            },
+        }
+
+    @pytest.fixture
+    def mock_openai_client(self):
+        """Mock client answering for 5.5.1 only."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "id": "5.5.1",
+                        "rules": [
+                            {
+                                "rule_text": "Combatants may make enemy combatants the object of attack.",
+                                "rule_type": "permission",
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+        mock_response.usage = Mock(prompt_tokens=500, completion_tokens=200, total_tokens=700)
+        mock_client.chat.completions.create.return_value = mock_response
+        return mock_client
+
+    def test_batch_uses_one_call_and_falls_back_for_missing_sections(
+        self, sections, mock_openai_client
+    ):
+        """Test one call covers the batch and an omitted section is retried alone."""
+        from src.pipeline.extract import extract_rules_batch
+
+        with (
+            patch("src.pipeline.extract.Path") as mock_path,
+            patch(
+                "src.pipeline.extract.extract_rules", return_value=[{"rule_id": "5.5.2_r0"}]
+            ) as mock_single,
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            results = extract_rules_batch(sections, mock_openai_client)
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        prompt = mock_openai_client.chat.completions.create.call_args.kwargs["messages"][1][
+            "content"
+        ]
+        assert "Section ID: 5.5.1" in prompt
+        assert "Section ID: 5.5.2" in prompt
+
+        assert list(results) == ["5.5.1", "5.5.2"]
+        rule = results["5.5.1"][0]
+        assert rule["rule_id"] == "5.5.1_r0"
+        assert rule["source_section"] == "5.5.1"
+        assert rule["source_page_numbers"] == [1]
+        mock_single.assert_called_once_with("5.5.2", sections["5.5.2"], mock_openai_client)
+        assert results["5.5.2"] == [{"rule_id": "5.5.2_r0"}]
+
+    def test_batch_falls_back_for_malformed_section_rules(self, sections, mock_openai_client):
+        """Test a section whose batched rules are not a list is retried alone."""
+        from src.pipeline.extract import extract_rules_batch
+
+        mock_openai_client.chat.completions.create.return_value.choices[
+            0
+        ].message.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "id": "5.5.1",
+                        "rules": [
+                            {
+                                "rule_text": "Combatants may make enemy combatants the object of attack.",
+                                "rule_type": "permission",
+                            }
+                        ],
+                    },
+                    {"id": "5.5.2", "rules": "no rules found"},
+                ]
+            }
+        )
+
+        with (
+            patch("src.pipeline.extract.Path") as mock_path,
+            patch(
+                "src.pipeline.extract.extract_rules", return_value=[{"rule_id": "5.5.2_r0"}]
+            ) as mock_single,
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            results = extract_rules_batch(sections, mock_openai_client)
+
+        assert results["5.5.1"][0]["rule_id"] == "5.5.1_r0"
+        mock_single.assert_called_once_with("5.5.2", sections["5.5.2"], mock_openai_client)
+        assert results["5.5.2"] == [{"rule_id": "5.5.2_r0"}]
+
+    def test_plan_rule_batches_respects_size_and_token_budget(self):
+        """Test batches close at batch_size or before exceeding the token budget."""
+        from src.pipeline.extract import plan_rule_batches
+
+        sections = {f"5.{i}": {"text": "x" * 400} for i in range(5)}  # ~100 tokens each
+
+        by_size = plan_rule_batches(sections, batch_size=2, token_budget=10_000)
+        by_budget = plan_rule_batches(sections, batch_size=8, token_budget=250)
+
+        assert [list(batch) for batch in by_size] == [["5.0", "5.1"], ["5.2", "5.3"], ["5.4"]]
+        assert [len(batch) for batch in by_budget] == [2, 2, 1]
+        assert len(plan_rule_batches(sections, batch_size=1)) == 5
 
 
 class TestValidateVerbatimRules:
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from src.config import MC_QUESTION_RESPONSE_FORMAT
 from src.pipeline.generate import (
     generate_definitional,
     generate_questions_for_rule,
@@ -129,7 +130,7 @@ class TestGenerateDefinitional:
         call_kwargs = mock_openai_client.chat.completions.create.call_args[1]
         assert call_kwargs["model"] == "gpt-4.1"
         assert call_kwargs["temperature"] == 0.3
-        assert call_kwargs["response_format"] == {"type": "json_object"}
+        assert call_kwargs["response_format"] == MC_QUESTION_RESPONSE_FORMAT
 
 
 class TestGenerateScenario:
@@ -285,6 +286,12 @@ class TestShouldGenerateRefusal:
 class TestGenerateQuestionsForRule:
     """Test the main question generation orchestrator."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.generate.save_json_file"):
+            yield
+
     @pytest.fixture
     def mock_openai_client(self):
         """Create a comprehensive mock client."""
@@ -398,6 +405,7 @@ class TestGenerateQuestionsForRule:
                 "question_id": "5.5_r0_def",
                 "question_type": "definitional",
                 "question": "Cached question?",
+                "metadata": {"source_rule": sample_rule["rule_text"]},
             }
         ]
 
@@ -420,6 +428,55 @@ class TestGenerateQuestionsForRule:
             # API should NOT be called
             mock_openai_client.chat.completions.create.assert_not_called()
 
+    def test_generate_questions_for_rule_regenerates_stale_cache(
+        self, mock_openai_client, sample_rule, tmp_path
+    ):
+        """Test cached questions from a different rule text are not reused."""
+        cache_file = tmp_path / "5.5_r0.json"
+        stale = [{"question_type": "definitional", "metadata": {"source_rule": "Old text"}}]
+        cache_file.write_text(json.dumps(stale))
+
+        with patch("src.pipeline.generate.Path", return_value=cache_file):
+            questions = generate_questions_for_rule(sample_rule, "5.5", 0, mock_openai_client)
+
+        assert len(questions) == 4
+        assert all(q["metadata"]["source_rule"] == sample_rule["rule_text"] for q in questions)
+
+    def test_generate_questions_for_rule_runs_types_concurrently(self, sample_rule):
+        """Test the question types are generated in parallel and returned in fixed order."""
+        import threading
+
+        # Every generator waits for all four, which only succeeds if they overlap
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_generator(question_type):
+            def generate(*args):
+                barrier.wait()
+                return {"question_type": question_type}
+
+            return generate
+
+        def fake_scenario(rule, section_id, rule_index, difficulty, client):
+            barrier.wait()
+            return {"question_type": f"scenario_{difficulty}"}
+
+        with (
+            patch("src.pipeline.generate.Path") as mock_path,
+            patch("src.pipeline.generate.generate_definitional", fake_generator("definitional")),
+            patch("src.pipeline.generate.generate_scenario", fake_scenario),
+            patch("src.pipeline.generate.generate_refusal", fake_generator("refusal")),
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            questions = generate_questions_for_rule(sample_rule, "5.5", 0, Mock())
+
+        assert [q["question_type"] for q in questions] == [
+            "definitional",
+            "scenario_easy",
+            "scenario_hard",
+            "refusal",
+        ]
+
     def test_generate_questions_for_rule_handles_error(self, sample_rule):
         """Test that errors are handled gracefully."""
         mock_client = Mock()
@@ -6,8 +6,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+import src.cli.utils as cli_utils
+from src.config import SECTION_HEADER_PATTERN, SECTION_HEADER_SEARCH_PATTERN
 from src.pipeline.extract import extract_rules, validate_verbatim_rules
-from src.pipeline.parse import _add_hierarchy, parse_document
+from src.pipeline.parse import _add_hierarchy, _extract_page_texts, _parse_pdf, parse_document
 
 
 class TestParsing:
@@ -19,8 +21,9 @@ class TestParsing:
         return "section_5_5.pdf"
 
     @pytest.fixture
-    def parsed_sections(self, pdf_path):
-        """Parse PDF once for all tests."""
+    def parsed_sections(self, pdf_path, monkeypatch):
+        """Parse PDF once for all tests (bypassing the parse cache)."""
+        monkeypatch.setattr(cli_utils, "IGNORE_CACHE", True)
         return parse_document(pdf_path)
 
     def test_parse_document_returns_dict(self, parsed_sections):
@@ -85,6 +88,72 @@ class TestParsing:
             expected_full = "Persons, Objects, and Locations That Are Not Protected From Being Made the Object of Attack"
             assert title == expected_full, f"Section 5.5.1 title should be complete. Got: {title}"
 
+    def test_parse_document_uses_content_hash_cache(self, tmp_path, monkeypatch):
+        """Test that a second parse of the same PDF is served from cache/parse."""
+        pdf_file = tmp_path / "manual.pdf"
+        pdf_file.write_bytes(Path("section_5_5.pdf").read_bytes())
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli_utils, "IGNORE_CACHE", False)
+
+        first = parse_document("manual.pdf", section_prefix="5.5.1")
+        assert len(list((tmp_path / "cache" / "parse").glob("*.json"))) == 1
+
+        with patch("src.pipeline.parse._parse_pdf") as mock_parse:
+            second = parse_document("manual.pdf", section_prefix="5.5.1")
+            mock_parse.assert_not_called()
+        assert second == first
+
+        # A different section filter is a different cache entry
+        parse_document("manual.pdf", section_prefix="5.5.2")
+        assert len(list((tmp_path / "cache" / "parse").glob("*.json"))) == 2
+
+    def test_parallel_page_extraction_matches_serial(self, pdf_path, parsed_sections):
+        """Test that splitting pages across worker processes yields the same sections."""
+        with (
+            patch("src.pipeline.parse.PARSE_PAGES_PER_WORKER", 1),
+            patch("src.pipeline.parse.os.cpu_count", return_value=2),
+        ):
+            assert _parse_pdf(pdf_path) == parsed_sections
+
+    def test_parallel_page_extraction_spawns_workers(self, pdf_path):
+        """Test that worker processes are spawned, never forked from a threaded parent."""
+        with (
+            patch("src.pipeline.parse.PARSE_PAGES_PER_WORKER", 1),
+            patch("src.pipeline.parse.os.cpu_count", return_value=2),
+            patch("src.pipeline.parse.ProcessPoolExecutor") as mock_pool,
+        ):
+            executor = mock_pool.return_value.__enter__.return_value
+            executor.submit.return_value.result.return_value = []
+            _extract_page_texts(pdf_path)
+
+        assert mock_pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+
+class TestSectionHeaderPatterns:
+    """Test the page-level header search agrees with the line-level header match."""
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "5.5.1 Persons, Objects, and Locations",
+            "  5.5 TARGETING\r",
+            "5.5\u00a0Title with non-breaking space\x0c",
+            "5.5",
+            "5 Not a section",
+            "Text mentioning 5.5.1 mid-line",
+            "",
+        ],
+    )
+    def test_search_matches_line_pattern(self, line):
+        """Test a header is found within a page exactly when its stripped line matches."""
+        page = f"preceding line\n{line}\nfollowing line"
+        found = SECTION_HEADER_SEARCH_PATTERN.search(page)
+        expected = SECTION_HEADER_PATTERN.match(line.strip())
+
+        assert bool(found) == bool(expected)
+        if expected:
+            assert found.groups() == expected.groups()
+
 
 class TestHierarchy:
     """Test hierarchy building functions."""
@@ -122,8 +191,9 @@ class TestFootnoteExtraction:
     """Test that footnotes are properly separated from main text."""
 
     @pytest.fixture
-    def parsed_sections(self):
-        """Parse PDF once for all footnote tests."""
+    def parsed_sections(self, monkeypatch):
+        """Parse PDF once for all footnote tests (bypassing the parse cache)."""
+        monkeypatch.setattr(cli_utils, "IGNORE_CACHE", True)
         return parse_document("section_5_5.pdf")
 
     def test_main_text_does_not_contain_footnote_content(self, parsed_sections):
@@ -169,6 +239,12 @@ class TestFootnoteExtraction:
 class TestRuleExtraction:
     """Test rule extraction functionality."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.extract.save_json_file"):
+            yield
+
     @pytest.fixture
     def mock_openai_client(self):
         """Create a mock OpenAI client."""
@@ -7,7 +7,9 @@ import pytest
 
 from src.pipeline.validate import (
     calculate_quality_score,
+    generate_validation_analysis,
     get_rule_confidence,
+    validate_and_filter_questions,
     validate_answer_entailment,
     validate_distractors,
     validate_structure,
@@ -146,6 +148,12 @@ class TestValidateStructure:
 class TestValidateEntailment:
     """Test entailment validation."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.validate.save_json_file"):
+            yield
+
     @pytest.fixture
     def mock_openai_client(self):
         """Mock OpenAI client that returns positive entailment."""
@@ -214,6 +222,12 @@ class TestValidateEntailment:
 class TestValidateDistractors:
     """Test distractor validation."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache_writes(self):
+        """Keep cache writes for mocked Paths off the real filesystem."""
+        with patch("src.pipeline.validate.save_json_file"):
+            yield
+
     @pytest.fixture
     def mock_openai_client(self):
         """Mock OpenAI client that returns good distractor validation."""
@@ -296,6 +310,40 @@ class TestValidateDistractors:
                 assert "distractor" in result
                 assert "distractor_index" in result
 
+    def test_validate_distractors_share_context_prefix(self, mock_openai_client, sample_question):
+        """Test every call opens with the same system and section/rule context messages."""
+        with (
+            patch("src.pipeline.validate.Path") as mock_path,
+            patch("src.pipeline.validate.load_section_text", return_value="Section text"),
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            validate_distractors(sample_question, mock_openai_client)
+
+        calls = mock_openai_client.chat.completions.create.call_args_list
+        prefixes = [call.kwargs["messages"][:2] for call in calls]
+        assert all(prefix == prefixes[0] for prefix in prefixes)
+        assert "Section text" in prefixes[0][1]["content"]
+        assert "The rule text" in prefixes[0][1]["content"]
+        assert "Wrong 2" in calls[1].kwargs["messages"][2]["content"]
+
+    def test_validate_distractors_validates_duplicates_once(
+        self, mock_openai_client, sample_question
+    ):
+        """Test a repeated distractor reuses the first verdict instead of another call."""
+        sample_question["incorrect_answers"] = ["Wrong 1", "Wrong 2", "Wrong 1"]
+        with (
+            patch("src.pipeline.validate.Path") as mock_path,
+            patch("src.pipeline.validate.load_section_text", return_value="Section text"),
+        ):
+            mock_path.return_value.exists.return_value = False
+
+            results = validate_distractors(sample_question, mock_openai_client)
+
+        assert mock_openai_client.chat.completions.create.call_count == 2
+        assert [r["distractor_index"] for r in results] == [0, 1, 2]
+        assert results[2]["reasoning"] == results[0]["reasoning"]
+
 
 class TestGetRuleConfidence:
     """Test get_rule_confidence helper function."""
@@ -447,3 +495,142 @@ class TestCalculateQualityScore:
         assert len(breakdown["failures"]) == 0
         assert "refusal_appropriateness" in breakdown["components"]
         assert breakdown["threshold"] == 90
+
+
+class TestValidateAndFilterQuestions:
+    """Test the validation orchestrator."""
+
+    @staticmethod
+    def make_question(question_id):
+        """Structurally valid definitional question."""
+        return {
+            "question_id": question_id,
+            "question_type": "definitional",
+            "question": "What is the rule?",
+            "correct_answer": "Answer",
+            "incorrect_answers": ["Wrong 1", "Wrong 2", "Wrong 3"],
+            "confidence": 95,
+            "metadata": {
+                "source_section": "5.5",
+                "source_rule": "Rule text",
+                "rule_type": "permission",
+                "footnotes_used": [],
+                "generation_model": "gpt-4.1",
+                "generation_timestamp": "2025-10-07T00:00:00",
+                "source_page_numbers": [1],
+            },
+        }
+
+    def test_concurrent_validation_keeps_question_order(self):
+        """Test LLM checks run concurrently but results keep input order."""
+        import time
+
+        questions = [self.make_question(f"5.5_r{i}_def") for i in range(4)]
+        questions.append({"question_id": "broken"})  # fails the structural gate
+        rules = [{"source_section": "5.5", "rule_text": "Rule text", "confidence": 95}]
+
+        def slow_entailment(question, client):
+            # Earlier questions finish last
+            time.sleep(0.01 * (4 - int(question["question_id"][5])))
+            return {"is_entailed": True, "confidence": 95}
+
+        with (
+            patch(
+                "src.pipeline.validate.validate_question_entailment", side_effect=slow_entailment
+            ),
+            patch(
+                "src.pipeline.validate.validate_answer_entailment",
+                return_value={"is_entailed": True, "confidence": 95},
+            ) as mock_answer,
+            patch(
+                "src.pipeline.validate.validate_distractors",
+                return_value=[{"quality_score": 95}] * 3,
+            ),
+        ):
+            validated, rejected, report = validate_and_filter_questions(
+                questions, {"5.5": {"text": "Content"}}, rules, Mock()
+            )
+
+        assert [q["question_id"] for q in validated] == [q["question_id"] for q in questions[:4]]
+        assert [q["question_id"] for q in rejected] == ["broken"]
+        assert report["structural_failures"] == 1
+        assert mock_answer.call_count == 4
+
+
+class TestGenerateValidationAnalysis:
+    """Test validation analysis report generation."""
+
+    @pytest.fixture
+    def report(self):
+        """Minimal validation report for two definitional questions."""
+        return {
+            "total_questions": 2,
+            "validated": 1,
+            "rejected": 1,
+            "by_type": {"definitional": {"validated": 1, "rejected": 1}},
+        }
+
+    def test_generate_validation_analysis_decile_buckets(self, report, tmp_path, monkeypatch):
+        """Test that scores land in the right decile, with exact 100s in their own bucket."""
+        monkeypatch.chdir(tmp_path)  # No cache/validation directory
+        questions = [
+            {"question_type": "definitional", "confidence": 95},
+            {"question_type": "definitional", "confidence": 100},
+        ]
+        rules = [{"confidence": 0}, {"confidence": 9.5}, {"confidence": 90}, {"confidence": 100}]
+
+        analysis = generate_validation_analysis(questions, questions[:1], [], report, rules)
+
+        assert "      0-9:    2 ( 50.0%)" in analysis
+        assert "     90-99:    1 ( 25.0%)" in analysis
+        assert "      100:    1 ( 25.0%)" in analysis
+        assert " 10-19:" not in analysis
+
+    def test_generate_validation_analysis_reads_cached_scores(self, report, tmp_path, monkeypatch):
+        """Test that validation cache files are routed to the right component by suffix."""
+        monkeypatch.chdir(tmp_path)
+        cache_dir = tmp_path / "cache" / "validation"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "5.5_r0_def_question_entailment.json").write_text(
+            json.dumps({"is_entailed": True, "confidence": 91})
+        )
+        (cache_dir / "5.5_r0_def_answer_entailment.json").write_text(
+            json.dumps({"is_entailed": True, "confidence": 92})
+        )
+        (cache_dir / "5.5_r0_def_distractors.json").write_text(
+            json.dumps([{"quality_score": 80}, {"quality_score": 85}, {"error": "timeout"}])
+        )
+        (cache_dir / "5.5_r0_refusal_refusal.json").write_text(
+            json.dumps({"appropriateness_score": 97})
+        )
+        (cache_dir / "5.5_r1_def_distractors.json").write_text("{not valid json")
+
+        analysis = generate_validation_analysis([], [], [], report, [])
+
+        assert "Question Entailment                    1   91.0" in analysis
+        assert "Answer Entailment                      1   92.0" in analysis
+        assert "Distractor Quality                     2   82.5" in analysis
+        assert "Refusal Appropriateness                1   97.0" in analysis
+
+    def test_generate_validation_analysis_reads_active_prompt_mode(
+        self, report, tmp_path, monkeypatch
+    ):
+        """Test that full-prompt and --compact-prompts cache files are analyzed separately."""
+        import src.cli.utils as cli_utils
+
+        monkeypatch.chdir(tmp_path)
+        cache_dir = tmp_path / "cache" / "validation"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "5.5_r0_def_question_entailment.json").write_text(
+            json.dumps({"confidence": 91})
+        )
+        (cache_dir / "5.5_r0_def_question_entailment_compact.json").write_text(
+            json.dumps({"confidence": 71})
+        )
+
+        full = generate_validation_analysis([], [], [], report, [])
+        monkeypatch.setattr(cli_utils, "COMPACT_PROMPT_MODE", True)
+        compact = generate_validation_analysis([], [], [], report, [])
+
+        assert "Question Entailment                    1   91.0" in full
+        assert "Question Entailment                    1   71.0" in compact